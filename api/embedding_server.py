@@ -0,0 +1,59 @@
+"""Embedding server app: load an embedder once at startup and serve /embed over HTTP."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from pydantic import BaseModel
+
+from embeddings.base import BaseEmbedder
+from storage.json_io import json_dumps
+
+
+class EmbedRequest(BaseModel):
+    """Body of POST /embed."""
+
+    texts: list[str]
+
+
+def _default_embedder() -> BaseEmbedder:
+    """BGE-M3 with the pipeline defaults (normalized vectors)."""
+    from embeddings.bge_m3_embedder import BgeM3Embedder
+
+    return BgeM3Embedder(model_name="BAAI/bge-m3", normalize=True)
+
+
+def create_embedding_app(embedder_factory: Callable[[], BaseEmbedder] | None = None) -> FastAPI:
+    """
+    Build the embedding server app.
+
+    embedder_factory runs once inside the lifespan, so the model is loaded and
+    warm before the first request and stays loaded for the life of the process.
+    Encoding runs in a worker thread to keep the event loop accepting requests.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        factory = embedder_factory or _default_embedder
+        app.state.embedder = await asyncio.to_thread(factory)
+        yield
+
+    app = FastAPI(title="Embedding server", lifespan=lifespan)
+
+    @app.get("/health")
+    def health(request: Request) -> dict[str, object]:
+        """Readiness check; reports the embedder class and vector dimension."""
+        embedder: BaseEmbedder = request.app.state.embedder
+        return {"status": "ok", "model": embedder.__class__.__name__, "vector_dim": embedder.vector_dim}
+
+    @app.post("/embed")
+    async def embed(body: EmbedRequest, request: Request) -> Response:
+        """Embed body.texts; returns {"vectors": [[...], ...]} in input order."""
+        embedder: BaseEmbedder = request.app.state.embedder
+        vectors = await asyncio.to_thread(embedder.embed_texts, body.texts)
+        return Response(content=json_dumps({"vectors": vectors}), media_type="application/json")
+
+    return app
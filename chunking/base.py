@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from schemas.chunk_document import ChunkDocument
     from schemas.parsed_unit import ParsedUnit
 
@@ -17,7 +19,14 @@ class BaseChunker(ABC):
     Strategy pattern; all chunkers return ChunkDocument with chunk_strategy set.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def chunk(self, unit: "ParsedUnit") -> list["ChunkDocument"]:
-        """Split unit into chunks; return list of ChunkDocument with strategy metadata."""
+    def chunk(self, unit: "ParsedUnit", created_at: "datetime | None" = None) -> list["ChunkDocument"]:
+        """
+        Split unit into chunks; return list of ChunkDocument with strategy metadata.
+
+        created_at: timestamp for every chunk; callers chunking many units pass one
+        shared value instead of reading the clock per unit. Defaults to now (UTC).
+        """
         ...
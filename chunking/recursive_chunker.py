@@ -2,56 +2,97 @@
 
 from __future__ import annotations
 
-import re
+import os
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import List
 
 from chunking.base import BaseChunker
-from rag.token_counter import estimate_token_count
+from rag.token_counter import estimate_token_counts
 from schemas.chunk_document import ChunkDocument
 from schemas.parsed_unit import ParsedUnit
 
 
-def _split_by_separators(text: str, separators: list[str]) -> List[str]:
-    """Split text by first matching separator; recurse on rest with remaining separators."""
-    if not separators:
-        return [text] if text.strip() else []
-    sep = separators[0]
-    parts = re.split(re.escape(sep), text) if sep else [text]
-    rest_seps = separators[1:]
-    result: List[str] = []
+def _split_into(
+    text: str, separators: Sequence[str], level: int, chunk_size: int, out: List[str]
+) -> None:
+    """
+    Append stripped pieces of text (longer than chunk_size) to out, splitting from separators[level].
+
+    Separators absent from text are skipped. Each split is one C-level str.split; only
+    pieces still over chunk_size recurse (depth is bounded by len(separators)). The empty
+    separator hard-cuts into chunk_size windows; past the last separator text is kept whole.
+    """
+    while level < len(separators) and separators[level] and separators[level] not in text:
+        level += 1
+    if level >= len(separators):
+        out.append(text)
+        return
+    sep = separators[level]
+    if sep:
+        parts = text.split(sep)
+    else:
+        parts = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
     for part in parts:
         part = part.strip()
         if not part:
             continue
-        if rest_seps:
-            result.extend(_split_by_separators(part, rest_seps))
+        if len(part) <= chunk_size:
+            out.append(part)
         else:
-            result.append(part)
+            _split_into(part, separators, level + 1, chunk_size, out)
+
+
+def _split_by_separators(text: str, separators: Sequence[str], chunk_size: int) -> List[str]:
+    """
+    Split text into pieces of at most chunk_size chars, trying separators in order.
+
+    A piece is split with the next separator only while it still exceeds chunk_size,
+    so short paragraphs are never broken up by lower-ranked separators.
+    """
+    result: List[str] = []
+    text = text.strip()
+    if len(text) <= chunk_size:
+        if text:
+            result.append(text)
+        return result
+    _split_into(text, separators, 0, chunk_size, result)
     return result
 
 
+def _uuid4_batch(n: int) -> List[str]:
+    """Return n random (version 4) UUID strings from a single os.urandom call."""
+    raw = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
 def _merge_small(chunks: List[str], chunk_size: int, overlap: int) -> List[str]:
-    """Merge small chunks up to chunk_size with overlap."""
+    """
+    Merge small chunks up to chunk_size with overlap.
+
+    buf_len tracks the joined length incrementally; the joined string is built only at
+    flush time, and the next buffer starts with the last overlap chars of that string
+    when they still fit alongside the next piece.
+    """
     if chunk_size <= 0:
         return chunks
     result: List[str] = []
     buf: List[str] = []
     buf_len = 0
     for c in chunks:
-        c_len = len(c) + (1 if buf else 0)
-        if buf_len + c_len > chunk_size and buf:
-            combined = " ".join(buf)
-            result.append(combined)
-            if overlap > 0 and buf:
-                buf = [buf[-1]] if len(buf[-1]) <= overlap else [buf[-1][-overlap:]]
-                buf_len = sum(len(x) for x in buf) + len(buf) - 1
+        if buf and buf_len + 1 + len(c) > chunk_size:
+            last = " ".join(buf)
+            result.append(last)
+            tail = last[-overlap:].lstrip() if overlap > 0 else ""
+            if tail and len(tail) + 1 + len(c) <= chunk_size:
+                buf = [tail]
+                buf_len = len(tail)
             else:
                 buf = []
                 buf_len = 0
+        buf_len += len(c) + (1 if buf else 0)
         buf.append(c)
-        buf_len += c_len + (1 if len(buf) > 1 else 0)
     if buf:
         result.append(" ".join(buf))
     return result
@@ -67,7 +108,10 @@ class RecursiveChunker(BaseChunker):
     Each unit is chunked independently so page_number and unit boundaries are preserved.
     """
 
-    DEFAULT_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+    __slots__ = ("chunk_size", "overlap", "separators")
+
+    # Immutable so instances share it instead of copying a list each
+    DEFAULT_SEPARATORS: tuple[str, ...] = ("\n\n", "\n", ". ", " ", "")
 
     def __init__(
         self,
@@ -78,40 +122,49 @@ class RecursiveChunker(BaseChunker):
         """Initialize with chunk_size, overlap, and optional separator list."""
         self.chunk_size = max(100, chunk_size)
         self.overlap = max(0, min(overlap, chunk_size // 2))
-        self.separators = separators if separators is not None else self.DEFAULT_SEPARATORS.copy()
+        self.separators = tuple(separators) if separators is not None else self.DEFAULT_SEPARATORS
 
-    def chunk(self, unit: ParsedUnit) -> list[ChunkDocument]:
+    def chunk(self, unit: ParsedUnit, created_at: datetime | None = None) -> list[ChunkDocument]:
         """
         Split this single ParsedUnit's text by separators and merge to chunk_size.
 
         Does not merge across ParsedUnits; each unit is chunked independently (page boundaries preserved).
+        created_at defaults to now (UTC) when not supplied by the caller.
         """
         text = (unit.text or "").strip()
         if not text:
             return []
-        created_at = datetime.now(timezone.utc)
-        source_uri = ""
-        if unit.metadata:
-            source_uri = unit.metadata.get("source_uri", "")
-        page_number = unit.metadata.get("page_number") if unit.metadata else None
-        section_title = unit.metadata.get("section_title") if unit.metadata else None
+        if created_at is None:
+            created_at = datetime.now(timezone.utc)
+        # ParsedUnit.metadata always defaults to a dict; no per-key truthiness guards needed
+        md = unit.metadata
+        source_uri = md.get("source_uri", "")
+        page_number = md.get("page_number")
+        section_title = md.get("section_title")
         doc_id = unit.doc_id
-        chunks = _split_by_separators(text, self.separators)
-        merged = _merge_small(chunks, self.chunk_size, self.overlap)
+        if len(text) <= self.chunk_size:
+            # Short units (TOC pages, short chapters) are one chunk; skip split and merge
+            merged = [text]
+        else:
+            chunks = _split_by_separators(text, self.separators, self.chunk_size)
+            merged = _merge_small(chunks, self.chunk_size, self.overlap)
+        chunk_ids = _uuid4_batch(len(merged))
+        token_counts = estimate_token_counts(merged)
+        # Same unit-level metadata for every chunk; each chunk gets its own copy
+        base_metadata: dict = {
+            "unit_index": unit.unit_index,
+            "unit_type": unit.unit_type,
+            "page_number": page_number,
+            "section_title": section_title,
+        }
         result: list[ChunkDocument] = []
         start = 0
         for i, block in enumerate(merged):
-            chunk_id = str(uuid.uuid4())
+            chunk_id = chunk_ids[i]
             end = start + len(block)
-            metadata: dict = {
-                "unit_index": unit.unit_index,
-                "unit_type": unit.unit_type,
-                "page_number": page_number,
-                "section_title": section_title,
-            }
-            token_count = estimate_token_count(block)
+            # Fields are built here from validated inputs; skip per-chunk Pydantic validation
             result.append(
-                ChunkDocument(
+                ChunkDocument.model_construct(
                     chunk_id=chunk_id,
                     doc_id=doc_id,
                     chunk_index=i,
@@ -119,11 +172,11 @@ class RecursiveChunker(BaseChunker):
                     start_char=start,
                     end_char=end,
                     chunk_strategy="recursive",
-                    token_count=token_count,
+                    token_count=token_counts[i],
                     page_number=page_number,
                     section_title=section_title,
                     source_uri=source_uri,
-                    metadata=metadata,
+                    metadata=base_metadata.copy(),
                     created_at=created_at,
                 )
             )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Type
 
 from chunking.base import BaseChunker
@@ -10,12 +11,32 @@ _registry: dict[str, type[BaseChunker]] = {}
 
 
 def register_chunker(name: str, chunker_class: type[BaseChunker]) -> None:
-    """Register a chunker class under the given name."""
+    """Register a chunker class under the given name (drops cached instances)."""
     _registry[name] = chunker_class
+    _cached_chunker.cache_clear()
 
 
-def get_chunker(name: str, **kwargs: object) -> BaseChunker:
-    """Return a chunker instance for the given name. kwargs passed to constructor."""
+def _build_chunker(name: str, kwargs: dict[str, object]) -> BaseChunker:
+    """Construct a new chunker for name with kwargs."""
     if name not in _registry:
         raise KeyError(f"Unknown chunker: {name}. Registered: {list(_registry)}")
     return _registry[name](**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_chunker(name: str, frozen_kwargs: frozenset[tuple[str, object]]) -> BaseChunker:
+    """One shared chunker per (name, kwargs); chunkers are stateless given their config."""
+    return _build_chunker(name, dict(frozen_kwargs))
+
+
+def get_chunker(name: str, **kwargs: object) -> BaseChunker:
+    """
+    Return a chunker instance for the given name. kwargs passed to constructor.
+
+    Identical (name, kwargs) calls return the same instance. Unhashable kwargs
+    (e.g. a list of separators) bypass the cache and build a new chunker.
+    """
+    try:
+        return _cached_chunker(name, frozenset(kwargs.items()))
+    except TypeError:
+        return _build_chunker(name, kwargs)
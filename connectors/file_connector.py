@@ -10,7 +10,24 @@ from typing import Iterator
 
 from connectors.base import BaseConnector
 from schemas.source_record import SourceRecord
-from storage.raw_store import RawStore
+from storage.raw_store import CHUNK_SIZE, RawStore
+
+
+# Leading magic bytes -> MIME type, for files whose extension mimetypes does not know
+_MAGIC_PREFIXES: list[tuple[bytes, str]] = [
+    (b"%PDF-", "application/pdf"),
+]
+_MAGIC_READ_BYTES = 8
+
+
+def _sniff_content_type(path: Path) -> str:
+    """Return MIME type from the file's leading bytes; application/octet-stream if unknown."""
+    with open(path, "rb") as f:
+        head = f.read(_MAGIC_READ_BYTES)
+    for prefix, content_type in _MAGIC_PREFIXES:
+        if head.startswith(prefix):
+            return content_type
+    return "application/octet-stream"
 
 
 class FileConnector(BaseConnector):
@@ -37,14 +54,15 @@ class FileConnector(BaseConnector):
         record_id = str(uuid.uuid4())
         content_type, _ = mimetypes.guess_type(str(path), strict=False)
         if content_type is None:
-            content_type = "application/octet-stream"
+            content_type = _sniff_content_type(path)
         size_bytes = path.stat().st_size
         fetched_at = datetime.now(timezone.utc)
 
-        with open(path, "rb") as f:
+        with open(path, "rb", buffering=CHUNK_SIZE) as f:
             content_ref, checksum = self._store.save_raw_bytes(record_id, f)
 
-        yield SourceRecord(
+        # Fields are built above with known types; skip per-field validation
+        yield SourceRecord.model_construct(
             record_id=record_id,
             source_type=source_type,
             source_uri=source_uri,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from schemas.source_document import SourceDocument
 from schemas.source_record import SourceRecord
@@ -16,10 +17,11 @@ class BaseDocumentBuilder(ABC):
     """
 
     @abstractmethod
-    def build(self, records: list[SourceRecord]) -> list[SourceDocument]:
+    def build(self, records: list[SourceRecord], built_at: datetime | None = None) -> list[SourceDocument]:
         """
         Build one or more SourceDocuments from the given records.
 
         May group multiple records into a single document (e.g. conversation).
+        built_at: shared build timestamp from the caller; defaults to now (UTC).
         """
         ...
@@ -17,14 +17,16 @@ class FileDocumentBuilder(BaseDocumentBuilder):
     Design allows chat/email builders to group many records into one document later.
     """
 
-    def build(self, records: list[SourceRecord]) -> list[SourceDocument]:
-        """Build one SourceDocument per SourceRecord; copy metadata and set built_at."""
-        built_at = datetime.now(timezone.utc)
+    def build(self, records: list[SourceRecord], built_at: datetime | None = None) -> list[SourceDocument]:
+        """Build one SourceDocument per SourceRecord; copy metadata and set built_at (default now, UTC)."""
+        if built_at is None:
+            built_at = datetime.now(timezone.utc)
         result: list[SourceDocument] = []
         for r in records:
             doc_id = str(uuid.uuid4())
+            # Every field comes from an already-validated SourceRecord, so skip re-validation
             result.append(
-                SourceDocument(
+                SourceDocument.model_construct(
                     doc_id=doc_id,
                     source_type=r.source_type,
                     source_uri=r.source_uri,
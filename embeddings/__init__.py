@@ -1,7 +1,33 @@
 """Embedding layer: text -> vectors. No vector DB logic."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from embeddings.base import BaseEmbedder
 from embeddings.batcher import batch_iter
-from embeddings.bge_m3_embedder import BgeM3Embedder
 
-__all__ = ["BaseEmbedder", "batch_iter", "BgeM3Embedder"]
+if TYPE_CHECKING:
+    from embeddings.bge_m3_embedder import BgeM3Embedder
+    from embeddings.embedding_cache import EmbeddingCache
+    from embeddings.http_embedder import HttpEmbedder
+    from embeddings.normalize import l2_normalize_rows
+
+# Exports backed by heavy modules (numpy, sentence-transformers, httpx), imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    "BgeM3Embedder": "embeddings.bge_m3_embedder",
+    "EmbeddingCache": "embeddings.embedding_cache",
+    "HttpEmbedder": "embeddings.http_embedder",
+    "l2_normalize_rows": "embeddings.normalize",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import heavy exports on first access so importing the package stays cheap."""
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["BaseEmbedder", "batch_iter", "BgeM3Embedder", "EmbeddingCache", "HttpEmbedder", "l2_normalize_rows"]
@@ -7,18 +7,12 @@ import numpy as np
 
 from embeddings.base import BaseEmbedder
 from embeddings.batcher import batch_iter
+from embeddings.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
-# L2 norm epsilon to avoid division by zero
-_NORM_EPS = 1e-12
-
-
-def _l2_normalize_vectors(vectors: np.ndarray) -> np.ndarray:
-    """L2 normalize row-wise. vec = vec / max(norm(vec), 1e-12)."""
-    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-    norms = np.maximum(norms, _NORM_EPS)
-    return vectors / norms
+# Supported inference precisions; half precisions apply on cuda only
+_PRECISIONS = ("fp32", "fp16", "bf16")
 
 
 class BgeM3Embedder(BaseEmbedder):
@@ -37,6 +31,8 @@ class BgeM3Embedder(BaseEmbedder):
         batch_size: int = 32,
         normalize: bool = True,
         device: str | None = None,
+        cache_size: int = 10_000,
+        precision: str = "fp32",
     ) -> None:
         """
         Initialize BGE-M3 embedder.
@@ -45,10 +41,15 @@ class BgeM3Embedder(BaseEmbedder):
         batch_size: batch size for encode.
         normalize: if True, L2-normalize embeddings for cosine-as-dot-product.
         device: cuda/cpu or None for auto (cuda if available else cpu).
+        cache_size: max vectors kept in the text-digest LRU cache; 0 disables caching.
+        precision: fp32, fp16, or bf16. Half precisions cast the model on cuda (ignored on cpu).
         """
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision}. Supported: {list(_PRECISIONS)}")
         self.model_name = model_name
         self.batch_size = max(1, batch_size)
         self.normalize = normalize
+        self._cache = EmbeddingCache(cache_size) if cache_size > 0 else None
         if device is not None:
             self._device = device
         else:
@@ -59,10 +60,21 @@ class BgeM3Embedder(BaseEmbedder):
                 self._device = "cpu"
         from sentence_transformers import SentenceTransformer
         self._model: SentenceTransformer = SentenceTransformer(model_name, device=self._device)
+        self._apply_precision(precision)
         # Compute vector_dim once via a test encode
         test_out = self._model.encode(["dummy"], convert_to_numpy=True, normalize_embeddings=False)
         self._vector_dim = int(test_out.shape[1]) if test_out.ndim == 2 else int(test_out.shape[0])
 
+    def _apply_precision(self, precision: str) -> None:
+        """Cast the model to fp16/bf16 on cuda; CPU keeps fp32 (half-precision matmuls are slow there)."""
+        if precision == "fp32" or not self._device.startswith("cuda"):
+            return
+        import torch
+
+        dtype = torch.float16 if precision == "fp16" else torch.bfloat16
+        self._model.to(dtype)
+        logger.info("BGE-M3 model cast to %s on %s", precision, self._device)
+
     @property
     def vector_dim(self) -> int:
         """Dimension of the embedding vector (from model)."""
@@ -70,37 +82,66 @@ class BgeM3Embedder(BaseEmbedder):
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """
-        Embed texts in batches; L2-normalize if configured; return list of vectors.
+        Embed texts in batches; return list of vectors (L2-normalized by encode if configured).
 
-        On batch encode failure: retry once with half the batch; if still fails, raise.
+        Texts already in the cache are not re-encoded. On batch encode failure: retry
+        once with half the batch; if still fails, raise.
         """
         if not texts:
             return []
-        all_vectors: list[np.ndarray] = []
-        for batch in batch_iter(texts, self.batch_size):
-            vectors = self._encode_batch_with_retry(batch)
-            if self.normalize:
-                vectors = _l2_normalize_vectors(vectors)
-            for i in range(len(vectors)):
-                all_vectors.append(vectors[i])
+        if self._cache is None:
+            stacked = self._encode_texts(texts)
+        else:
+            stacked = self._embed_with_cache(texts, self._cache)
+        # One C-level conversion for the whole stack instead of one per row
+        return stacked.tolist()
+
+    def _embed_with_cache(self, texts: list[str], cache: EmbeddingCache) -> np.ndarray:
+        """Serve cached texts from cache; encode each distinct miss once and cache it."""
+        keys = [cache.key(t) for t in texts]
+        rows = [cache.get(k) for k in keys]
+        misses = {k: t for k, t, row in zip(keys, texts, rows) if row is None}
+        if misses:
+            encoded = self._encode_texts(list(misses.values()))
+            fresh = {k: encoded[i].copy() for i, k in enumerate(misses)}
+            for k, vector in fresh.items():
+                cache.put(k, vector)
+            rows = [row if row is not None else fresh[k] for k, row in zip(keys, rows)]
+        return np.vstack(rows)
+
+    def _encode_texts(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode texts to a (len(texts), vector_dim) array in input order.
+
+        Texts are sorted by length before batching so each batch pads less.
+        """
+        # Length-bucket: batches of similar-length texts pad less; restore input order after
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+        batch_outputs = [self._encode_batch_with_retry(batch) for batch in batch_iter(sorted_texts, self.batch_size)]
+        encoded = np.vstack(batch_outputs)
+        stacked = np.empty_like(encoded)
+        stacked[order] = encoded
         # Consistency check
         dim = self._vector_dim
-        for v in all_vectors:
-            if v.shape[0] != dim:
-                raise ValueError(f"Unexpected vector dimension {v.shape[0]} vs {dim}")
-        return [v.tolist() for v in all_vectors]
+        if stacked.shape[1] != dim:
+            raise ValueError(f"Unexpected vector dimension {stacked.shape[1]} vs {dim}")
+        return stacked
 
     def _encode_batch_with_retry(self, batch: list[str]) -> np.ndarray:
-        """Encode one batch; on failure retry once with half batch if batch size > 1."""
+        """Encode one batch; on failure retry once with half batch if batch size > 1.
+
+        Normalization runs inside encode (on-device when using cuda) when normalize=True.
+        """
         try:
             out = self._model.encode(
                 batch,
                 convert_to_numpy=True,
-                normalize_embeddings=False,
+                normalize_embeddings=self.normalize,
             )
             if out.ndim == 1:
                 out = out.reshape(1, -1)
-            return out
+            return np.ascontiguousarray(out, dtype=np.float32)
         except Exception as e:
             if len(batch) > 1:
                 mid = len(batch) // 2
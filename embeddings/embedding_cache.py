@@ -0,0 +1,55 @@
+"""In-process LRU cache of embedding vectors keyed by a digest of the text."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Never updated, only copied: cheaper than constructing a blake2b context per key
+_KEY_HASHER = hashlib.blake2b(digest_size=16)
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU mapping text digest -> embedding vector.
+
+    Skips re-encoding repeated texts (page headers/footers, re-ingested docs).
+    Keys are 16-byte blake2b digests so long chunk texts are not held as keys.
+    Safe to share between threads embedding concurrent batches.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """Initialize with the maximum number of vectors kept (least recently used evicted first)."""
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """Return the cache key for text."""
+        hasher = _KEY_HASHER.copy()
+        hasher.update(text.encode("utf-8"))
+        return hasher.digest()
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        """Return the cached vector for key (marking it recently used), or None."""
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+            return vector
+
+    def put(self, key: bytes, vector: np.ndarray) -> None:
+        """Store vector under key; evict least recently used entries beyond max_entries."""
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Number of cached vectors."""
+        return len(self._entries)
@@ -0,0 +1,67 @@
+"""HTTP embedder: delegate embed_texts to a running embedding server (see api.embedding_server)."""
+
+from __future__ import annotations
+
+import httpx
+
+from embeddings.base import BaseEmbedder
+from embeddings.batcher import batch_iter
+from storage.json_io import json_loads
+
+# Generous default: the first request on a cold GPU can take a while
+DEFAULT_TIMEOUT_S = 300.0
+
+
+class HttpEmbedder(BaseEmbedder):
+    """
+    Embedder backed by a long-lived embedding server.
+
+    The server keeps the model loaded, so a pipeline run using this embedder
+    skips the model load entirely. Texts are sent in batch_size slices;
+    transport errors and non-2xx responses raise httpx errors to the caller.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8765",
+        batch_size: int = 256,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        uds: str | None = None,
+        client: httpx.Client | None = None,
+    ) -> None:
+        """
+        Initialize the client.
+
+        base_url: server root URL (host is ignored when uds is set).
+        batch_size: max texts per POST /embed.
+        uds: Unix domain socket path the server listens on, if any.
+        client: pre-built httpx client (tests); overrides base_url, timeout and uds.
+        """
+        self.batch_size = max(1, batch_size)
+        if client is None:
+            transport = httpx.HTTPTransport(uds=uds) if uds else None
+            client = httpx.Client(base_url=base_url, timeout=timeout, transport=transport)
+        self._client = client
+        self._vector_dim: int | None = None
+
+    @property
+    def vector_dim(self) -> int:
+        """Dimension reported by the server's /health (fetched once)."""
+        if self._vector_dim is None:
+            response = self._client.get("/health")
+            response.raise_for_status()
+            self._vector_dim = int(response.json()["vector_dim"])
+        return self._vector_dim
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """POST texts to /embed in batches; return vectors in input order."""
+        vectors: list[list[float]] = []
+        for batch in batch_iter(texts, self.batch_size):
+            response = self._client.post("/embed", json={"texts": batch})
+            response.raise_for_status()
+            vectors.extend(json_loads(response.content)["vectors"])
+        return vectors
+
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        self._client.close()
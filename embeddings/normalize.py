@@ -0,0 +1,20 @@
+"""Row-wise L2 normalization shared by embedders and vector stores."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# L2 norm floor so zero vectors stay zero instead of dividing by zero
+NORM_EPS = 1e-12
+
+
+def l2_normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2 normalize row-wise in place and return vectors: vec = vec / max(norm(vec), 1e-12).
+
+    Square-sum is fused via einsum and the division writes into vectors (float array).
+    """
+    norms = np.einsum("ij,ij->i", vectors, vectors)
+    np.sqrt(norms, out=norms)
+    np.maximum(norms, NORM_EPS, out=norms)
+    vectors /= norms[:, None]
+    return vectors
@@ -43,7 +43,8 @@ class PDFExtractor(BaseExtractor):
             return
         created_at = datetime.now(timezone.utc)
         try:
-            raw = self._store.load_raw_bytes(doc.content_ref)
+            # Hand pypdf the open blob so it seeks lazily instead of parsing a full in-memory copy
+            f = open(self._store.path_of(doc.content_ref), "rb")
         except OSError as e:
             yield ParsedUnit(
                 doc_id=doc.doc_id,
@@ -59,51 +60,50 @@ class PDFExtractor(BaseExtractor):
                 created_at=created_at,
             )
             return
-        try:
-            from io import BytesIO
-
-            reader = PdfReader(BytesIO(raw))
-            for i, page in enumerate(reader.pages):
-                try:
-                    text = page.extract_text() or ""
-                    yield ParsedUnit(
-                        doc_id=doc.doc_id,
-                        unit_index=i,
-                        unit_type="page",
-                        text=text,
-                        structure=None,
-                        metadata={"page_number": i + 1, "source_uri": doc.source_uri},
-                        parse_status="success",
-                        error=None,
-                        error_type=None,
-                        error_message=None,
-                        created_at=created_at,
-                    )
-                except Exception as e:
-                    yield ParsedUnit(
-                        doc_id=doc.doc_id,
-                        unit_index=i,
-                        unit_type="page",
-                        text=None,
-                        structure=None,
-                        metadata={"page_number": i + 1, "source_uri": doc.source_uri},
-                        parse_status="failed",
-                        error=str(e),
-                        error_type="PageReadError",
-                        error_message=str(e),
-                        created_at=created_at,
-                    )
-        except Exception as e:
-            yield ParsedUnit(
-                doc_id=doc.doc_id,
-                unit_index=0,
-                unit_type="page",
-                text=None,
-                structure=None,
-                metadata={},
-                parse_status="failed",
-                error=str(e),
-                error_type="ExtractionError",
-                error_message=str(e),
-                created_at=created_at,
-            )
+        with f:
+            try:
+                reader = PdfReader(f)
+                for i, page in enumerate(reader.pages):
+                    try:
+                        text = page.extract_text() or ""
+                        yield ParsedUnit(
+                            doc_id=doc.doc_id,
+                            unit_index=i,
+                            unit_type="page",
+                            text=text,
+                            structure=None,
+                            metadata={"page_number": i + 1, "source_uri": doc.source_uri},
+                            parse_status="success",
+                            error=None,
+                            error_type=None,
+                            error_message=None,
+                            created_at=created_at,
+                        )
+                    except Exception as e:
+                        yield ParsedUnit(
+                            doc_id=doc.doc_id,
+                            unit_index=i,
+                            unit_type="page",
+                            text=None,
+                            structure=None,
+                            metadata={"page_number": i + 1, "source_uri": doc.source_uri},
+                            parse_status="failed",
+                            error=str(e),
+                            error_type="PageReadError",
+                            error_message=str(e),
+                            created_at=created_at,
+                        )
+            except Exception as e:
+                yield ParsedUnit(
+                    doc_id=doc.doc_id,
+                    unit_index=0,
+                    unit_type="page",
+                    text=None,
+                    structure=None,
+                    metadata={},
+                    parse_status="failed",
+                    error=str(e),
+                    error_type="ExtractionError",
+                    error_message=str(e),
+                    created_at=created_at,
+                )
@@ -0,0 +1,101 @@
+"""Background append-only writer: callers enqueue bytes, one thread drains and writes them."""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_CLOSE = object()
+
+
+class AuditLogWriter:
+    """
+    Append records to a log file from a dedicated writer thread.
+
+    enqueue() never touches the disk, so the embed loop keeps running while the
+    writer coalesces everything queued so far into one os.write on an O_APPEND
+    descriptor. Use as a context manager; close() flushes and joins the thread.
+    The file (and its parent directories) is created by the writer thread on the
+    first record, so a run that audits nothing touches no files. Creating and
+    writing are best-effort: failures are logged, never raised to the caller.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize for path and start the writer thread."""
+        self._path = Path(path)
+        self._queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, data: bytes) -> None:
+        """Queue data (one or more complete lines) for appending; empty data is ignored."""
+        if data:
+            self._queue.put(data)
+
+    def close(self) -> None:
+        """Write everything queued so far, then stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+
+    def __enter__(self) -> AuditLogWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _drain(self, first: bytes) -> tuple[list[bytes], bool]:
+        """Collect first plus everything already queued; second value is True once close was requested."""
+        parts: list[bytes] = [first]
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return parts, False
+            if item is _CLOSE:
+                return parts, True
+            parts.append(item)  # type: ignore[arg-type]
+
+    def _open(self) -> int | None:
+        """Create parent directories and open the log for appending; None (logged) on failure."""
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            return os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.warning("audit log open failed for %s: %s", self._path, e, exc_info=True)
+            return None
+
+    def _run(self) -> None:
+        """Writer loop: block for the next record, coalesce the backlog, write it in one call."""
+        first = self._queue.get()
+        if first is _CLOSE:
+            return
+        fd = self._open()
+        try:
+            while True:
+                parts, closing = self._drain(first)  # type: ignore[arg-type]
+                self._write_all(fd, b"".join(parts))
+                if closing:
+                    break
+                first = self._queue.get()
+                if first is _CLOSE:
+                    break
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def _write_all(self, fd: int | None, buf: bytes) -> None:
+        """os.write until buf is fully written; log and drop it on error (or if the file never opened)."""
+        if fd is None:
+            return
+        view = memoryview(buf)
+        try:
+            while view:
+                view = view[os.write(fd, view) :]
+        except OSError as e:
+            logger.warning("audit log write failed for %s: %s", self._path, e, exc_info=True)
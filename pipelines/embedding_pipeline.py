@@ -7,22 +7,105 @@ vectors and EmbeddingRecord JSONL. No retrieval or RAG logic.
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain, islice
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without ijson
+    ijson = None  # type: ignore[assignment]
+
 from schemas.chunk_document import ChunkDocument
 from schemas.embedding_record import EmbeddingRecord
+from storage.json_io import json_loads
 
 from embeddings.base import BaseEmbedder
+from pipelines.audit_log_writer import AuditLogWriter
 from vector_store.base import BaseVectorStore
 
 logger = logging.getLogger(__name__)
 
+# Parses chunk files straight from bytes into models in pydantic-core (one pass,
+# no intermediate dict tree); built once and reused for every document.
+_CHUNK_LIST_ADAPTER = TypeAdapter(list[ChunkDocument])
+# Serializes one audit record straight to JSON bytes (no intermediate str).
+_RECORD_ADAPTER = TypeAdapter(EmbeddingRecord)
+
 DEFAULT_CHUNKS_DIR = "data/chunks"
 DEFAULT_AUDIT_LOG_PATH = "data/embeddings/records.jsonl"
+DEFAULT_LOAD_WORKERS = 4
+DEFAULT_MAX_INFLIGHT_BATCHES = 1
+# Chunks per vector store write; the CLI default can be overridden via CHROMA_ADD_BATCH
+DEFAULT_STORE_BATCH_SIZE = 2048
+STORE_BATCH_SIZE_ENV = "CHROMA_ADD_BATCH"
+# Env var naming a running embedding server for the CLI (see scripts/embedding_server.py)
+EMBEDDING_SERVER_URL_ENV = "EMBEDDING_SERVER_URL"
+
+
+def _construct_trusted(item: Any, path: Path) -> ChunkDocument:
+    """
+    Build a ChunkDocument from a trusted chunk-file item without field validation.
+
+    Raises ValueError for items that are not JSON objects. created_at is parsed
+    from its ISO string, so trusted chunks carry the same types as validated ones.
+    """
+    if not isinstance(item, dict):
+        raise ValueError(f"Invalid chunk file {path}: expected JSON objects, got {type(item).__name__}")
+    created_at = item.get("created_at")
+    if isinstance(created_at, str):
+        item["created_at"] = datetime.fromisoformat(created_at)
+    return ChunkDocument.model_construct(**item)
+
+
+class _ChunkLoadError(Exception):
+    """A chunk file could not be read or parsed; __cause__ holds the original error."""
+
+
+def _guard_load(chunks: Iterator[ChunkDocument]) -> Iterator[ChunkDocument]:
+    """Re-raise load errors from a lazy chunk iterator as _ChunkLoadError, leaving downstream errors alone."""
+    try:
+        yield from chunks
+    except (FileNotFoundError, ValueError) as e:
+        raise _ChunkLoadError(str(e)) from e
+
+
+@dataclass
+class _BatchColumns:
+    """One embed batch in columnar form: parallel lists indexed by position in the batch."""
+
+    ids: list[str] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+    doc_ids: list[str] = field(default_factory=list)
+    metadatas: list[dict[str, Any]] = field(default_factory=list)
+
+    def distinct_doc_ids(self) -> list[str]:
+        """Sorted distinct doc_ids in the batch (for log messages)."""
+        return sorted(set(self.doc_ids))
+
+    def extend(self, other: _BatchColumns) -> None:
+        """Append other's rows after this batch's rows."""
+        self.ids.extend(other.ids)
+        self.texts.extend(other.texts)
+        self.doc_ids.extend(other.doc_ids)
+        self.metadatas.extend(other.metadatas)
+
+
+@dataclass
+class _StoreBuffer:
+    """Embedded rows waiting for one large vector store write."""
+
+    cols: _BatchColumns = field(default_factory=_BatchColumns)
+    vectors: list[list[float]] = field(default_factory=list)
 
 
 class EmbeddingPipeline:
@@ -38,6 +121,10 @@ class EmbeddingPipeline:
         batch_size: int = 32,
         audit_log_path: str = DEFAULT_AUDIT_LOG_PATH,
         chunks_dir: str = DEFAULT_CHUNKS_DIR,
+        validate_chunks: bool = True,
+        load_workers: int = DEFAULT_LOAD_WORKERS,
+        max_inflight_batches: int = DEFAULT_MAX_INFLIGHT_BATCHES,
+        store_batch_size: int = DEFAULT_STORE_BATCH_SIZE,
     ) -> None:
         """
         Initialize the embedding pipeline.
@@ -48,19 +135,35 @@ class EmbeddingPipeline:
             batch_size: Max texts per embed_texts call.
             audit_log_path: Path to JSONL file for EmbeddingRecord rows.
             chunks_dir: Directory containing <doc_id>.json chunk files.
+            validate_chunks: If False, trust chunk files (as written by the ingestion
+                orchestrator) and build ChunkDocuments without field validation.
+            load_workers: Threads that read and parse chunk files ahead of the
+                embed loop in run_for_all (1 = load inline).
+            max_inflight_batches: Embed calls allowed to run concurrently (1 = sequential).
+                Values above 1 require a thread-safe embedder; results are still
+                stored in batch order.
+            store_batch_size: Embedded chunks buffered per add_embeddings call. Large
+                writes are much cheaper per row in Chroma; a failed write counts
+                every buffered chunk as an error.
         """
         self._embedder = embedder
         self._vector_store = vector_store
         self._batch_size = max(1, batch_size)
         self._audit_log_path = audit_log_path
         self._chunks_dir = Path(chunks_dir)
+        self._validate_chunks = validate_chunks
+        self._load_workers = max(1, load_workers)
+        self._max_inflight = max(1, max_inflight_batches)
+        self._store_batch_size = max(1, store_batch_size)
 
-    def load_chunks(self, doc_id: str) -> list[ChunkDocument]:
+    def load_chunks(self, doc_id: str, validate: bool = True) -> list[ChunkDocument]:
         """
         Read and parse chunk JSON for a document.
 
         Args:
             doc_id: Document id; file read from chunks_dir / f"{doc_id}.json".
+            validate: If False, skip schema validation and use model_construct
+                (only for trusted files produced by this codebase).
 
         Returns:
             List of ChunkDocument instances.
@@ -70,21 +173,52 @@ class EmbeddingPipeline:
             ValueError: If JSON is invalid or does not match ChunkDocument schema.
         """
         path = self._chunks_dir / f"{doc_id}.json"
-        if not path.exists():
-            raise FileNotFoundError(f"Chunk file not found: {path}")
-
-        with open(path, encoding="utf-8") as f:
-            raw = json.load(f)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Chunk file not found: {path}") from None
+
+        if not validate:
+            raw = json_loads(data)
+            if not isinstance(raw, list):
+                raise ValueError(f"Expected JSON array in {path}, got {type(raw).__name__}")
+            return [_construct_trusted(item, path) for item in raw]
+        try:
+            return _CHUNK_LIST_ADAPTER.validate_json(data)
+        except ValidationError as e:
+            raise ValueError(f"Invalid chunk file {path}: {e}") from e
 
-        if not isinstance(raw, list):
-            raise ValueError(f"Expected JSON array in {path}, got {type(raw).__name__}")
+    def iter_chunks(self, doc_id: str, validate: bool = True) -> Iterator[ChunkDocument]:
+        """
+        Yield a document's chunks one at a time.
 
-        chunks: list[ChunkDocument] = []
-        for i, item in enumerate(raw):
-            if not isinstance(item, dict):
-                raise ValueError(f"Expected object at index {i} in {path}")
-            chunks.append(ChunkDocument.model_validate(item))
-        return chunks
+        With ijson installed the file is parsed incrementally, so only the chunks
+        not yet consumed downstream are held in memory; otherwise falls back to
+        load_chunks. Raises FileNotFoundError / ValueError like load_chunks, but
+        lazily (on iteration).
+        """
+        if ijson is None:
+            yield from self.load_chunks(doc_id, validate=validate)
+            return
+        path = self._chunks_dir / f"{doc_id}.json"
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Chunk file not found: {path}") from None
+        with f:
+            try:
+                events = ijson.parse(f, use_float=True)
+                first = next(events, None)
+                if first is None or first[1] != "start_array":
+                    found = first[1] if first else "empty file"
+                    raise ValueError(f"Expected JSON array in {path}, got {found}")
+                for item in ijson.items(chain([first], events), "item"):
+                    if validate:
+                        yield ChunkDocument.model_validate(item)
+                    else:
+                        yield _construct_trusted(item, path)
+            except (ijson.JSONError, ValidationError) as e:
+                raise ValueError(f"Invalid chunk file {path}: {e}") from e
 
     def build_metadata(self, chunk: ChunkDocument) -> dict[str, Any]:
         """
@@ -103,6 +237,208 @@ class EmbeddingPipeline:
             "token_count": chunk.token_count if chunk.token_count is not None else 0,
         }
 
+    def _filter_new(self, chunks: list[ChunkDocument], summary: dict[str, int]) -> list[ChunkDocument]:
+        """Return chunks not yet in the vector store; count the rest as skipped (idempotency).
+
+        Uses one existing_ids lookup for all chunks instead of a has_id call per chunk.
+        """
+        existing = self._vector_store.existing_ids([c.chunk_id for c in chunks])
+        summary["skipped"] += len(existing)
+        return [c for c in chunks if c.chunk_id not in existing]
+
+    def _iter_new_batches(
+        self, chunks: Iterable[ChunkDocument], summary: dict[str, int]
+    ) -> Iterator[list[ChunkDocument]]:
+        """Filter chunks against the store window by window; yield full batch_size batches of new ones."""
+        it = iter(chunks)
+        pending: list[ChunkDocument] = []
+        while window := list(islice(it, self._batch_size)):
+            pending.extend(self._filter_new(window, summary))
+            while len(pending) >= self._batch_size:
+                yield pending[: self._batch_size]
+                pending = pending[self._batch_size :]
+        if pending:
+            yield pending
+
+    def _to_columns(self, batch: list[ChunkDocument]) -> _BatchColumns:
+        """Split a batch into id/text/doc_id/metadata columns in one pass over its chunks."""
+        cols = _BatchColumns()
+        for chunk in batch:
+            cols.ids.append(chunk.chunk_id)
+            cols.texts.append(chunk.text)
+            cols.doc_ids.append(chunk.doc_id)
+            cols.metadatas.append(self.build_metadata(chunk))
+        return cols
+
+    def _embed_chunks(self, cols: _BatchColumns) -> list[list[float]] | None:
+        """
+        Embed the texts of one batch (retry once); None on failure or vector count mismatch.
+
+        Touches no pipeline state, so several batches may run in worker threads.
+        """
+        vectors = None
+        for attempt in range(2):
+            try:
+                vectors = self._embedder.embed_texts(cols.texts)
+                break
+            except Exception as e:
+                logger.warning(
+                    "embed_texts failed for doc_ids=%s (attempt %s): %s",
+                    cols.distinct_doc_ids(),
+                    attempt + 1,
+                    e,
+                    exc_info=attempt > 0,
+                )
+        if vectors is not None and len(vectors) != len(cols.texts):
+            logger.warning(
+                "embedder returned %s vectors for %s texts, skipping batch",
+                len(vectors),
+                len(cols.texts),
+            )
+            return None
+        return vectors
+
+    def _buffer_batch(
+        self,
+        buf: _StoreBuffer,
+        cols: _BatchColumns,
+        vectors: list[list[float]] | None,
+        summary: dict[str, int],
+        audit: AuditLogWriter,
+    ) -> None:
+        """Add an embedded batch to buf (failed embeds count as errors); store buf once it is full."""
+        if vectors is None:
+            summary["errors"] += len(cols.ids)
+            return
+        buf.cols.extend(cols)
+        buf.vectors.extend(vectors)
+        if len(buf.vectors) >= self._store_batch_size:
+            self._flush(buf, summary, audit)
+
+    def _flush(self, buf: _StoreBuffer, summary: dict[str, int], audit: AuditLogWriter) -> None:
+        """Store everything in buf with one add_embeddings call and empty it."""
+        if buf.vectors:
+            self._store_batch(buf.cols, buf.vectors, summary, audit)
+            buf.cols, buf.vectors = _BatchColumns(), []
+
+    def _store_batch(
+        self,
+        cols: _BatchColumns,
+        vectors: list[list[float]],
+        summary: dict[str, int],
+        audit: AuditLogWriter,
+    ) -> None:
+        """
+        Add embedded rows to the vector store and queue their audit records.
+
+        Rows may come from different documents. Updates summary in place.
+        """
+        try:
+            self._vector_store.add_embeddings(ids=cols.ids, vectors=vectors, metadatas=cols.metadatas)
+        except Exception as e:
+            logger.warning(
+                "vector_store.add_embeddings failed for doc_ids=%s batch: %s",
+                cols.distinct_doc_ids(),
+                e,
+                exc_info=True,
+            )
+            summary["errors"] += len(cols.ids)
+            return
+
+        self._append_audit(cols, audit)
+        summary["embedded"] += len(cols.ids)
+
+    def _embed_batches(
+        self,
+        batches: Iterable[list[ChunkDocument]],
+        summary: dict[str, int],
+        audit: AuditLogWriter,
+    ) -> None:
+        """
+        Embed and store batches in order, with up to max_inflight_batches embed calls running at once.
+
+        Embedded batches are buffered and written store_batch_size rows at a time.
+        Store writes and audit enqueues happen on the calling thread, in batch order.
+        If batches raises (e.g. a truncated chunk file), rows already embedded or
+        in flight are still stored and audited before the error propagates.
+        """
+        columns = map(self._to_columns, batches)
+        buf = _StoreBuffer()
+        try:
+            if self._max_inflight == 1:
+                for cols in columns:
+                    self._buffer_batch(buf, cols, self._embed_chunks(cols), summary, audit)
+                return
+            with ThreadPoolExecutor(max_workers=self._max_inflight) as ex:
+                inflight: deque[tuple[_BatchColumns, Future[list[list[float]] | None]]] = deque()
+                try:
+                    for cols in columns:
+                        inflight.append((cols, ex.submit(self._embed_chunks, cols)))
+                        if len(inflight) >= self._max_inflight:
+                            done, future = inflight.popleft()
+                            self._buffer_batch(buf, done, future.result(), summary, audit)
+                finally:
+                    while inflight:
+                        done, future = inflight.popleft()
+                        self._buffer_batch(buf, done, future.result(), summary, audit)
+        finally:
+            self._flush(buf, summary, audit)
+
+    def _append_audit(self, cols: _BatchColumns, audit: AuditLogWriter) -> None:
+        """Queue one EmbeddingRecord per chunk in the batch for the audit log (best-effort).
+
+        Reuses the metadata column already sent to the vector store. The batch is
+        serialized up front and handed to the background writer as one buffer.
+        """
+        model_name = self._embedder.__class__.__name__
+        vector_dim = self._embedder.vector_dim
+        now = datetime.now(timezone.utc)
+        try:
+            # Fields come from already-validated chunks, so records skip re-validation
+            records = [
+                EmbeddingRecord.model_construct(
+                    embedding_id=chunk_id,
+                    chunk_id=chunk_id,
+                    doc_id=doc_id,
+                    model_name=model_name,
+                    vector_dim=vector_dim,
+                    created_at=now,
+                    metadata=metadata,
+                )
+                for chunk_id, doc_id, metadata in zip(cols.ids, cols.doc_ids, cols.metadatas)
+            ]
+            audit.enqueue(b"".join(_RECORD_ADAPTER.dump_json(rec) + b"\n" for rec in records))
+        except Exception as e:
+            logger.warning(
+                "audit log append failed for doc_ids=%s batch: %s",
+                cols.distinct_doc_ids(),
+                e,
+                exc_info=True,
+            )
+            # Count as embedded; log already written best-effort
+
+    def _try_load(self, doc_id: str) -> list[ChunkDocument] | None:
+        """Load chunks for doc_id, or log the failure and return None."""
+        try:
+            return self.load_chunks(doc_id, validate=self._validate_chunks)
+        except (FileNotFoundError, ValueError) as e:
+            logger.exception("load_chunks failed for doc_id=%s: %s", doc_id, e)
+            return None
+
+    def _iter_loaded(self, doc_ids: list[str]) -> Iterator[list[ChunkDocument] | None]:
+        """Yield _try_load results in doc_ids order, keeping up to 2 * load_workers loads in flight."""
+        if self._load_workers == 1:
+            yield from map(self._try_load, doc_ids)
+            return
+        with ThreadPoolExecutor(max_workers=self._load_workers) as ex:
+            inflight: deque[Future[list[ChunkDocument] | None]] = deque()
+            for doc_id in doc_ids:
+                inflight.append(ex.submit(self._try_load, doc_id))
+                if len(inflight) >= 2 * self._load_workers:
+                    yield inflight.popleft().result()
+            while inflight:
+                yield inflight.popleft().result()
+
     def run_for_doc(self, doc_id: str) -> dict[str, int]:
         """
         Run embedding pipeline for one document: load, filter, batch embed, store, audit.
@@ -117,112 +453,25 @@ class EmbeddingPipeline:
         """
         summary: dict[str, int] = {"embedded": 0, "skipped": 0, "errors": 0}
 
+        # Only chunk-file errors are counted here; embed and store errors propagate
+        chunks = _guard_load(self.iter_chunks(doc_id, validate=self._validate_chunks))
         try:
-            chunks = self.load_chunks(doc_id)
-        except (FileNotFoundError, ValueError) as e:
+            with AuditLogWriter(self._audit_log_path) as audit:
+                self._embed_batches(self._iter_new_batches(chunks, summary), summary, audit)
+        except _ChunkLoadError as e:
             logger.exception("load_chunks failed for doc_id=%s: %s", doc_id, e)
             summary["errors"] += 1
-            return summary
-
-        # Idempotency: only embed chunks not already in the store
-        to_embed: list[ChunkDocument] = []
-        for chunk in chunks:
-            if self._vector_store.has_id(chunk.chunk_id):
-                summary["skipped"] += 1
-            else:
-                to_embed.append(chunk)
-
-        if not to_embed:
-            return summary
-
-        # Batch by batch_size
-        audit_log_path = Path(self._audit_log_path)
-        audit_log_path.parent.mkdir(parents=True, exist_ok=True)
-        model_name = self._embedder.__class__.__name__
-        vector_dim = self._embedder.vector_dim
-
-        for start in range(0, len(to_embed), self._batch_size):
-            batch = to_embed[start : start + self._batch_size]
-            ids_batch = [c.chunk_id for c in batch]
-            texts_batch = [c.text for c in batch]
-            metadatas_batch = [self.build_metadata(c) for c in batch]
-
-            # Embed (retry once on failure)
-            vectors = None
-            for attempt in range(2):
-                try:
-                    vectors = self._embedder.embed_texts(texts_batch)
-                    break
-                except Exception as e:
-                    logger.warning(
-                        "embed_texts failed for doc_id=%s batch start=%s (attempt %s): %s",
-                        doc_id,
-                        start,
-                        attempt + 1,
-                        e,
-                        exc_info=attempt > 0,
-                    )
-            if vectors is None:
-                summary["errors"] += len(batch)
-                continue
-
-            if len(vectors) != len(ids_batch):
-                logger.warning(
-                    "embedder returned %s vectors for %s texts, skipping batch",
-                    len(vectors),
-                    len(texts_batch),
-                )
-                summary["errors"] += len(batch)
-                continue
-
-            # Add to vector store
-            try:
-                self._vector_store.add_embeddings(
-                    ids=ids_batch,
-                    vectors=vectors,
-                    metadatas=metadatas_batch,
-                )
-            except Exception as e:
-                logger.warning(
-                    "vector_store.add_embeddings failed for doc_id=%s batch: %s",
-                    doc_id,
-                    e,
-                    exc_info=True,
-                )
-                summary["errors"] += len(batch)
-                continue
-
-            # Append audit log (one EmbeddingRecord per chunk in batch)
-            now = datetime.now(timezone.utc)
-            try:
-                with open(audit_log_path, "a", encoding="utf-8") as f:
-                    for i, chunk in enumerate(batch):
-                        rec = EmbeddingRecord(
-                            embedding_id=chunk.chunk_id,
-                            chunk_id=chunk.chunk_id,
-                            doc_id=chunk.doc_id,
-                            model_name=model_name,
-                            vector_dim=vector_dim,
-                            created_at=now,
-                            metadata=self.build_metadata(chunk),
-                        )
-                        f.write(rec.model_dump_json() + "\n")
-            except Exception as e:
-                logger.warning(
-                    "audit log append failed for doc_id=%s batch: %s",
-                    doc_id,
-                    e,
-                    exc_info=True,
-                )
-                # Count as embedded; log already written best-effort
-            summary["embedded"] += len(batch)
-
         return summary
 
     def run_for_all(self) -> dict[str, int]:
         """
         Run pipeline for every doc_id found under chunks_dir (*.json).
 
+        New chunks are buffered across documents so every embed call gets a full
+        batch_size batch; only the final batch may be smaller. Chunk files are
+        loaded ahead in worker threads; embedding and store writes stay on the
+        calling thread, so the vector store needs no locking.
+
         Returns:
             Aggregated summary: {"embedded": int, "skipped": int, "errors": int}.
         """
@@ -231,15 +480,25 @@ class EmbeddingPipeline:
             logger.warning("Chunks dir does not exist: %s", self._chunks_dir)
             return total
 
-        for path in sorted(self._chunks_dir.glob("*.json")):
-            doc_id = path.stem
-            summary = self.run_for_doc(doc_id)
-            total["embedded"] += summary["embedded"]
-            total["skipped"] += summary["skipped"]
-            total["errors"] += summary["errors"]
-
+        doc_ids = self._list_doc_ids()
+        chunks = self._iter_loaded_chunks(doc_ids, total)
+        with AuditLogWriter(self._audit_log_path) as audit:
+            self._embed_batches(self._iter_new_batches(chunks, total), total, audit)
         return total
 
+    def _list_doc_ids(self) -> list[str]:
+        """Sorted doc_ids of the *.json files in chunks_dir (scandir: no Path objects, dirent type checks)."""
+        with os.scandir(self._chunks_dir) as it:
+            return sorted(e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file())
+
+    def _iter_loaded_chunks(self, doc_ids: list[str], summary: dict[str, int]) -> Iterator[ChunkDocument]:
+        """Yield chunks of every loadable doc in doc_ids order; count unloadable docs as errors."""
+        for chunks in self._iter_loaded(doc_ids):
+            if chunks is None:
+                summary["errors"] += 1
+                continue
+            yield from chunks
+
 
 def _main() -> None:
     """CLI: --doc-id X or --all. Uses embedder and vector store from env/config."""
@@ -267,6 +526,29 @@ def _main() -> None:
         default=32,
         help="Max texts per embed batch.",
     )
+    parser.add_argument(
+        "--max-inflight-batches",
+        type=int,
+        default=DEFAULT_MAX_INFLIGHT_BATCHES,
+        help="Embed batches allowed in flight at once.",
+    )
+    parser.add_argument(
+        "--store-batch-size",
+        type=int,
+        default=int(os.environ.get(STORE_BATCH_SIZE_ENV, DEFAULT_STORE_BATCH_SIZE)),
+        help=f"Embedded chunks per vector store write. Env: {STORE_BATCH_SIZE_ENV}.",
+    )
+    parser.add_argument(
+        "--trust-chunks",
+        action="store_true",
+        help="Skip schema validation of chunk files written by the ingestion pipeline.",
+    )
+    parser.add_argument(
+        "--embed-url",
+        type=str,
+        default=os.environ.get(EMBEDDING_SERVER_URL_ENV),
+        help=f"Embedding server URL (scripts/embedding_server.py); skips the local model load. Env: {EMBEDDING_SERVER_URL_ENV}.",
+    )
     parser.add_argument(
         "--vector-store-path",
         type=str,
@@ -287,10 +569,17 @@ def _main() -> None:
     )
 
     # Lazy imports so CLI works without heavy deps if only --help
-    from embeddings.bge_m3_embedder import BgeM3Embedder
     from vector_store import ChromaVectorStore
 
-    embedder = BgeM3Embedder(batch_size=args.batch_size)
+    embedder: BaseEmbedder
+    if args.embed_url:
+        from embeddings.http_embedder import HttpEmbedder
+
+        embedder = HttpEmbedder(base_url=args.embed_url, batch_size=args.batch_size)
+    else:
+        from embeddings.bge_m3_embedder import BgeM3Embedder
+
+        embedder = BgeM3Embedder(batch_size=args.batch_size)
     vector_store = ChromaVectorStore(persist_dir=args.vector_store_path)
 
     pipeline = EmbeddingPipeline(
@@ -299,6 +588,9 @@ def _main() -> None:
         batch_size=args.batch_size,
         audit_log_path=args.audit_log,
         chunks_dir=args.chunks_dir,
+        validate_chunks=not args.trust_chunks,
+        max_inflight_batches=args.max_inflight_batches,
+        store_batch_size=args.store_batch_size,
     )
 
     if args.all:
@@ -10,31 +10,64 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from chunking.registry import get_chunker
 from connectors.file_connector import FileConnector
 from document_builders.file_document_builder import FileDocumentBuilder
 from extractors.registry import get_extractor
 from observability.logger import get_logger
+from pipelines.prefetch import prefetch_iter
 from rag.text_normalizer import normalize_text
 from schemas.chunk_document import ChunkDocument
 from schemas.parsed_unit import ParsedUnit
 from schemas.source_document import SourceDocument
+from storage.file_lock import atomic_write_bytes
+from storage.json_io import json_dumps
 from storage.parsed_unit_store import persist_parsed_units
 from storage.raw_store import RawStore
-from state.sync_state import load_sync_state, update_sync_state
-from state.unit_progress import load_unit_progress, update_unit_progress
+from state.sync_state import compact_sync_state, load_sync_state, update_sync_state
+from state.unit_progress import (
+    UnitProgressRecord,
+    load_unit_progress,
+    save_unit_progress,
+    set_unit_progress,
+)
 
 CHUNKS_DIR = Path("data/chunks")
+# Max ParsedUnits extracted ahead of chunking (bounds memory to ~this many pages per doc)
+DEFAULT_PREFETCH_UNITS = 64
+# Save unit progress every N units (and on failed units / document end); resume redoes at most N-1 units
+DEFAULT_CHECKPOINT_INTERVAL = 50
 logger = get_logger("pipelines.ingestion_orchestrator")
 
+# Serializes a chunk list to JSON bytes in one pydantic-core pass (no intermediate dicts).
+_CHUNKS_ADAPTER = TypeAdapter(list[ChunkDocument])
+
 
 def _persist_chunks(doc_id: str, chunks: list[ChunkDocument]) -> None:
-    """Persist chunks to JSON under data/chunks/ (one file per doc_id)."""
+    """Persist chunks to JSON under data/chunks/ (one file per doc_id, renamed into place)."""
     CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
-    path = CHUNKS_DIR / f"{doc_id}.json"
-    data = [c.model_dump(mode="json") for c in chunks]
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    atomic_write_bytes(CHUNKS_DIR / f"{doc_id}.json", _CHUNKS_ADAPTER.dump_json(chunks, indent=2))
+
+
+def _checkpoint_unit(
+    progress: dict[str, UnitProgressRecord],
+    doc: SourceDocument,
+    unit: ParsedUnit,
+    interval: int,
+) -> bool:
+    """
+    Record unit as doc's last processed unit in the loaded progress dict.
+
+    Saves doc's record to the progress file every interval units and on any
+    non-success unit. Returns True if the recorded progress is not yet saved.
+    """
+    set_unit_progress(progress, doc.doc_id, unit.unit_index, doc.checksum)
+    if unit.unit_index % interval == 0 or unit.parse_status != "success":
+        save_unit_progress(progress, doc_ids=[doc.doc_id])
+        return False
+    return True
 
 
 def run_ingestion(
@@ -46,6 +79,8 @@ def run_ingestion(
     save_parsed_units: bool = False,
     use_unit_checkpoint: bool = True,
     preview: bool = False,
+    prefetch_units: int = DEFAULT_PREFETCH_UNITS,
+    checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
     before_extract: Callable[[SourceDocument], None] | None = None,
     after_extract: Callable[[ParsedUnit], None] | None = None,
     after_chunk: Callable[[ChunkDocument], None] | None = None,
@@ -58,6 +93,8 @@ def run_ingestion(
     save_parsed_units: if True, write ParsedUnits to data/parsed_units/<doc_id>.jsonl.
     use_unit_checkpoint: if True, resume at last_unit_index (restart-at-page-N).
     preview: if True, do not persist chunks or state; return chunks_by_doc and parsed_units_by_doc for inspection.
+    prefetch_units: how many units the extraction thread may run ahead of chunking and checkpointing.
+    checkpoint_interval: save unit progress every N units (always on failures and at document end).
     before_extract(doc), after_extract(unit), after_chunk(chunk): optional hooks for metrics/tracing/eval.
     """
     store = raw_store if raw_store is not None else RawStore()
@@ -80,6 +117,7 @@ def run_ingestion(
             out["parsed_units_by_doc"] = []
         return out
     records = list(connector.fetch(path))
+    store.flush()
     if not records:
         logger.info("ingestion | no records from path: %s", path)
         out = {"documents": 0, "chunks": 0, "skipped": 0, "errors": []}
@@ -87,12 +125,17 @@ def run_ingestion(
             out["chunks_by_doc"] = []
             out["parsed_units_by_doc"] = []
         return out
-    docs = doc_builder.build(records)
+    # One timestamp per run for built_at / chunk created_at instead of a clock read per unit
+    run_started_at = datetime.now(timezone.utc)
+    docs = doc_builder.build(records, built_at=run_started_at)
     total_chunks = 0
     skipped = 0
     chunks_by_doc_list: list[dict[str, Any]] = []
     parsed_units_by_doc_list: list[dict[str, Any]] = []
     sync_state = load_sync_state() if skip_if_processed and not preview else {}
+    # Loaded once per run and updated in memory; saved at each checkpoint without re-reading
+    unit_progress = load_unit_progress() if use_unit_checkpoint and not preview else {}
+    checkpoint_interval = max(1, checkpoint_interval)
     for doc in docs:
         if skip_if_processed and doc.checksum:
             rec = sync_state.get(doc.source_uri)
@@ -114,10 +157,11 @@ def run_ingestion(
         chunker = get_chunker(chunker_name)
         doc_chunks: list[ChunkDocument] = []
         doc_units: list[ParsedUnit] = []
-        unit_progress = load_unit_progress() if use_unit_checkpoint and not preview else {}
         last_index = unit_progress.get(doc.doc_id)
         resume_after = (last_index.last_unit_index + 1) if last_index else 0
-        for unit in extractor.extract_stream(doc):
+        unsaved_progress = False
+        # Extraction runs in a producer thread up to prefetch_units ahead of chunking
+        for unit in prefetch_iter(extractor.extract_stream(doc), maxsize=prefetch_units):
             if use_unit_checkpoint and not preview and unit.unit_index < resume_after:
                 continue
             if after_extract is not None:
@@ -126,18 +170,20 @@ def run_ingestion(
                 doc_units.append(unit)
             if unit.parse_status == "failed" and not unit.text:
                 if use_unit_checkpoint and not preview:
-                    update_unit_progress(doc.doc_id, unit.unit_index, doc.checksum)
+                    unsaved_progress = _checkpoint_unit(unit_progress, doc, unit, checkpoint_interval)
                 continue
             text = normalize_text(unit.text or "")
             # Later: header/footer stripper (layout cleaner) before chunking to reduce RAG noise
             if text.strip():
                 unit_for_chunk = unit.model_copy(update={"text": text})
-                for chunk in chunker.chunk(unit_for_chunk):
+                for chunk in chunker.chunk(unit_for_chunk, created_at=run_started_at):
                     if after_chunk is not None:
                         after_chunk(chunk)
                     doc_chunks.append(chunk)
             if use_unit_checkpoint and not preview:
-                update_unit_progress(doc.doc_id, unit.unit_index, doc.checksum)
+                unsaved_progress = _checkpoint_unit(unit_progress, doc, unit, checkpoint_interval)
+        if unsaved_progress:
+            save_unit_progress(unit_progress, doc_ids=[doc.doc_id])
         if preview:
             chunks_by_doc_list.append({
                 "doc_id": doc.doc_id,
@@ -167,6 +213,9 @@ def run_ingestion(
                 doc.source_uri,
                 len(doc_chunks),
             )
+    if not preview:
+        # update_sync_state only appends to a log; fold it into the state file once per run
+        compact_sync_state()
     result: dict[str, Any] = {
         "documents": len(docs),
         "chunks": total_chunks,
@@ -187,6 +236,8 @@ def main() -> None:
     parser.add_argument("--save-parsed-units", action="store_true", help="Persist ParsedUnits to data/parsed_units/<doc_id>.jsonl")
     parser.add_argument("--no-unit-checkpoint", action="store_true", help="Disable unit-level checkpoint (restart-at-page-N)")
     parser.add_argument("--preview", action="store_true", help="Do not persist; return chunks_by_doc and parsed_units_by_doc for inspection")
+    parser.add_argument("--prefetch-units", type=int, default=DEFAULT_PREFETCH_UNITS, help="Units extracted ahead of chunking")
+    parser.add_argument("--checkpoint-interval", type=int, default=DEFAULT_CHECKPOINT_INTERVAL, help="Save unit progress every N units")
     parser.add_argument("--preview-out", metavar="PATH", help="When using --preview, write chunks/units to this JSON file")
     args = parser.parse_args()
     result = run_ingestion(
@@ -195,16 +246,18 @@ def main() -> None:
         save_parsed_units=args.save_parsed_units,
         use_unit_checkpoint=not args.no_unit_checkpoint,
         preview=args.preview,
+        prefetch_units=args.prefetch_units,
+        checkpoint_interval=args.checkpoint_interval,
     )
     if args.preview and args.preview_out:
         out_path = Path(args.preview_out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(
+        out_path.write_bytes(
+            json_dumps(
                 {"chunks_by_doc": result.get("chunks_by_doc", []), "parsed_units_by_doc": result.get("parsed_units_by_doc", [])},
-                f,
-                indent=2,
+                indent=True,
             )
+        )
         print(f"Preview written to {out_path}", file=sys.stderr)
     if args.preview and result.get("chunks_by_doc"):
         for entry in result["chunks_by_doc"]:
@@ -0,0 +1,66 @@
+"""Bounded-queue prefetch: run an iterator in a producer thread so the consumer overlaps with it."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PREFETCH_SIZE = 8
+_PUT_TIMEOUT_S = 0.1
+_DONE = object()
+
+
+@dataclass
+class _ProducerError:
+    """Exception raised by the producer, re-raised in the consumer."""
+
+    error: BaseException
+
+
+def prefetch_iter(items: Iterable[T], maxsize: int = DEFAULT_PREFETCH_SIZE) -> Iterator[T]:
+    """
+    Yield items from a producer thread through a bounded queue.
+
+    The producer runs at most maxsize items ahead, so memory stays bounded while
+    I/O-bound production (e.g. PDF extraction) overlaps with the consumer's work.
+    Order is preserved; producer exceptions are re-raised here. Closing the
+    generator early stops the producer.
+    """
+    q: queue.Queue[object] = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_PUT_TIMEOUT_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in items:
+                if not _put(item):
+                    return
+        except BaseException as e:
+            _put(_ProducerError(e))
+            return
+        _put(_DONE)
+
+    threading.Thread(target=_produce, name="prefetch-producer", daemon=True).start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield item  # type: ignore[misc]
+    finally:
+        stop.set()
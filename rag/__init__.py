@@ -1,6 +1,6 @@
 """Retriever, prompt builder, generator, citations."""
 
 from rag.text_normalizer import normalize_ligatures, normalize_text
-from rag.token_counter import estimate_token_count
+from rag.token_counter import estimate_token_count, estimate_token_counts
 
-__all__ = ["normalize_ligatures", "normalize_text", "estimate_token_count"]
+__all__ = ["normalize_ligatures", "normalize_text", "estimate_token_count", "estimate_token_counts"]
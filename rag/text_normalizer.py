@@ -19,6 +19,9 @@ LIGATURE_MAP: list[tuple[str, str]] = [
     ("\u2014", "-"),   # em dash
 ]
 
+# Single-pass translation table built from LIGATURE_MAP (str.translate accepts multi-char values).
+_LIGATURE_TABLE = str.maketrans(dict(LIGATURE_MAP))
+
 
 def normalize_ligatures(text: str) -> str:
     """
@@ -26,9 +29,7 @@ def normalize_ligatures(text: str) -> str:
 
     Reduces embedding noise and improves search matching.
     """
-    for lig, replacement in LIGATURE_MAP:
-        text = text.replace(lig, replacement)
-    return text
+    return text.translate(_LIGATURE_TABLE)
 
 
 def normalize_text(text: str) -> str:
@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 
-_tiktoken_encoder = None
+import functools
+import os
 
+# Fewer texts than this are encoded inline: tiktoken's batch call builds a thread pool per call
+_MIN_BATCH_TEXTS = 16
+# Thread cap for batch encoding, so callers already running in N processes stay bounded
+_MAX_ENCODE_THREADS = 4
 
+
+@functools.cache
 def _get_encoder():
-    """Lazy-load tiktoken encoder (cl100k_base for OpenAI-style models)."""
-    global _tiktoken_encoder
-    if _tiktoken_encoder is None:
-        try:
-            import tiktoken
-            _tiktoken_encoder = tiktoken.get_encoding("cl100k_base")
-        except (ImportError, LookupError):
-            pass
-    return _tiktoken_encoder
+    """Lazy-load tiktoken encoder (cl100k_base for OpenAI-style models); None if unavailable.
+
+    Cached, including a failed load, so tiktoken is imported at most once per process.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except (ImportError, LookupError):
+        return None
 
 
 def estimate_token_count(text: str) -> int | None:
@@ -24,9 +31,26 @@ def estimate_token_count(text: str) -> int | None:
     Returns None if tiktoken is not installed. Used for context packing,
     retrieval scoring, and agent prompt building.
     """
-    if not text:
-        return 0
     enc = _get_encoder()
     if enc is None:
-        return None
-    return len(enc.encode(text))
+        return 0 if not text else None
+    return len(enc.encode_ordinary(text))
+
+
+def estimate_token_counts(texts: list[str]) -> list[int | None]:
+    """
+    Estimate token counts for many texts.
+
+    Short lists are encoded inline; longer ones use one tiktoken encode_ordinary_batch
+    call on at most _MAX_ENCODE_THREADS threads. Returns a list of None if tiktoken
+    is not installed; empty texts count as 0.
+    """
+    if not texts:
+        return []
+    enc = _get_encoder()
+    if enc is None:
+        return [0 if not t else None for t in texts]
+    if len(texts) < _MIN_BATCH_TEXTS:
+        return [len(enc.encode_ordinary(t)) for t in texts]
+    threads = min(_MAX_ENCODE_THREADS, os.cpu_count() or 1)
+    return [len(tokens) for tokens in enc.encode_ordinary_batch(texts, num_threads=threads)]
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Run the embedding server: BGE-M3 loaded once, POST /embed served until stopped.
+
+Point the embedding pipeline at it with --embed-url (or EMBEDDING_SERVER_URL) so
+each pipeline run skips the model load.
+
+Usage:
+  PYTHONPATH=. python scripts/embedding_server.py --port 8765
+  PYTHONPATH=. python scripts/embedding_server.py --uds /tmp/embed.sock
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve BGE-M3 embeddings over HTTP.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bind address.")
+    parser.add_argument("--port", type=int, default=8765, help="Bind port.")
+    parser.add_argument("--uds", type=str, default=None, help="Listen on this Unix domain socket instead of host/port.")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    from api.embedding_server import create_embedding_app
+
+    uvicorn.run(create_embedding_app(), host=args.host, port=args.port, uds=args.uds, workers=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
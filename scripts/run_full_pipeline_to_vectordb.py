@@ -1,28 +1,50 @@
 #!/usr/bin/env python3
 """Run full pipeline to vector DB: ensure chunks exist, run embedding pipeline, verify.
 
+Stages run in this process (no python -m subprocesses), so the embedding model
+is loaded once and reused by the verification run.
+
 Flow:
   1. If --path <file> given: run ingestion (connector → extract → chunk → persist).
+     With --paths a b c ..., paths are ingested by a forkserver process pool,
+     several at a time (LOAD_DOCUMENTS_NUMBER_OF_THREADS, default cpu_count - 1).
   2. Else: ensure data/chunks has at least one doc (writes test chunk JSON if empty).
-  3. Run embedding pipeline (--all).
+  3. Run embedding pipeline over all chunk files.
   4. Verify vector store count and idempotency (second run skips).
 
 Usage:
   PYTHONPATH=. python scripts/run_full_pipeline_to_vectordb.py
   PYTHONPATH=. python scripts/run_full_pipeline_to_vectordb.py --path /path/to/file.pdf
+  PYTHONPATH=. python scripts/run_full_pipeline_to_vectordb.py --paths a.pdf b.pdf c.docx
+  EMBEDDING_SERVER_URL=http://127.0.0.1:8765 PYTHONPATH=. python scripts/run_full_pipeline_to_vectordb.py
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import json
-import subprocess
+import logging
+import multiprocessing
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Project root
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if TYPE_CHECKING:
+    from pipelines.embedding_pipeline import EmbeddingPipeline
+    from vector_store import ChromaVectorStore
+
+# Env var capping concurrent ingestion processes for --paths
+LOAD_THREADS_ENV = "LOAD_DOCUMENTS_NUMBER_OF_THREADS"
+
+logger = logging.getLogger(__name__)
 
 
 def _ensure_test_chunks() -> str | None:
@@ -75,88 +97,120 @@ def _ensure_test_chunks() -> str | None:
 
 
 def _run_ingestion(path: str, *, no_skip: bool = False) -> bool:
-    """Run ingestion orchestrator on path. Returns True on success.
-    no_skip: if True, pass --no-skip so already-processed docs are re-ingested.
+    """Run ingestion on path in this process. Returns True if it produced chunks.
+    no_skip: if True, re-ingest documents already recorded in sync state.
+    A failing ingestion is logged and returns False, so one bad path in
+    _run_ingestion_many does not discard the other paths' results.
     """
-    cmd = [
-        sys.executable,
-        "-m",
-        "pipelines.ingestion_orchestrator",
-        "--path",
-        path,
-    ]
-    if no_skip:
-        cmd.append("--no-skip")
-    result = subprocess.run(
-        cmd,
-        cwd=str(ROOT),
-        env={**__import__("os").environ, "PYTHONPATH": str(ROOT)},
-        capture_output=True,
-        text=True,
-        timeout=300,
-    )
-    if result.returncode != 0:
-        print(result.stderr or result.stdout, file=sys.stderr)
-        return False
-    # Ingestion prints JSON (possibly with leading/trailing log output)
-    raw = result.stdout.strip()
-    start = raw.find("{")
-    end = raw.rfind("}") + 1
-    if start < 0 or end <= start:
-        print("Ingestion did not output valid JSON", file=sys.stderr)
+    try:
+        from pipelines.ingestion_orchestrator import run_ingestion
+
+        out = run_ingestion({"path": path}, skip_if_processed=not no_skip)
+    except Exception:
+        logger.exception("Ingestion failed for %s", path)
         return False
-    out = json.loads(raw[start:end])
     if out.get("errors"):
         print("Ingestion errors:", out["errors"], file=sys.stderr)
     print(f"Ingestion: documents={out.get('documents', 0)} chunks={out.get('chunks', 0)} skipped={out.get('skipped', 0)}", file=sys.stderr)
     return out.get("chunks", 0) > 0
 
 
-def _run_embedding_pipeline() -> dict:
-    """Run embedding pipeline --all. Returns summary dict."""
-    cmd = [
-        sys.executable,
-        "-m",
-        "pipelines.embedding_pipeline",
-        "--all",
-        "-v",
-    ]
-    result = subprocess.run(
-        cmd,
-        cwd=str(ROOT),
-        env={**__import__("os").environ, "PYTHONPATH": str(ROOT)},
-        capture_output=True,
-        text=True,
-        timeout=600,
+def _ingestion_workers(n_paths: int) -> int:
+    """Concurrent ingestion processes: LOAD_DOCUMENTS_NUMBER_OF_THREADS if set, else cpu_count - 1."""
+    raw = os.environ.get(LOAD_THREADS_ENV, "").strip()
+    try:
+        workers = int(raw) if raw else (os.cpu_count() or 2) - 1
+    except ValueError:
+        print(f"Ignoring invalid {LOAD_THREADS_ENV}={raw!r}", file=sys.stderr)
+        workers = (os.cpu_count() or 2) - 1
+    return max(1, min(workers, n_paths))
+
+
+def _run_ingestion_many(paths: list[str], *, no_skip: bool = False) -> bool:
+    """
+    Ingest paths in a process pool, several at a time. Returns True if any path produced chunks.
+
+    Extraction and chunking are CPU-bound Python, so they need processes, not
+    threads. Workers come from a forkserver, which starts them without copying
+    this process (and any loaded model or threads) and imports the stages once
+    per worker, not once per path. The shared state they write (sync state,
+    raw-store checksum index, unit progress) is updated under file locks and
+    merged on save; per-doc chunk and parsed-unit files are renamed into place.
+    """
+    workers = _ingestion_workers(len(paths))
+    print(f"Running ingestion for {len(paths)} paths ({workers} at a time)...", file=sys.stderr)
+    ctx = multiprocessing.get_context("forkserver")
+    with ctx.Pool(workers) as pool:
+        results = pool.map(functools.partial(_run_ingestion, no_skip=no_skip), paths)
+    return any(results)
+
+
+def _resolve_paths(raw_paths: list[str]) -> list[str] | None:
+    """Resolve raw_paths to unique absolute strings; None (after printing which) if any is missing."""
+    resolved: list[str] = []
+    for raw in raw_paths:
+        path = Path(raw)
+        if not path.exists():
+            print(f"Path not found: {path}", file=sys.stderr)
+            return None
+        resolved.append(str(path.resolve()))
+    return list(dict.fromkeys(resolved))
+
+
+def _open_vector_store() -> ChromaVectorStore:
+    """Open the persistent vector store under data/vector_store."""
+    from vector_store import ChromaVectorStore
+
+    return ChromaVectorStore(persist_dir=str(ROOT / "data" / "vector_store"))
+
+
+def _build_embedding_pipeline(store: ChromaVectorStore) -> EmbeddingPipeline:
+    """
+    Embedding pipeline over data/chunks writing to store; the embedder is created once here.
+
+    If EMBEDDING_SERVER_URL is set, texts are embedded by that server
+    (scripts/embedding_server.py) instead of a model loaded in this process.
+    """
+    from embeddings.base import BaseEmbedder
+    from pipelines.embedding_pipeline import EMBEDDING_SERVER_URL_ENV, EmbeddingPipeline
+
+    embedder: BaseEmbedder
+    url = os.environ.get(EMBEDDING_SERVER_URL_ENV)
+    if url:
+        from embeddings.http_embedder import HttpEmbedder
+
+        embedder = HttpEmbedder(base_url=url)
+    else:
+        from embeddings.bge_m3_embedder import BgeM3Embedder
+
+        embedder = BgeM3Embedder()
+    return EmbeddingPipeline(
+        embedder=embedder,
+        vector_store=store,
+        audit_log_path=str(ROOT / "data" / "embeddings" / "records.jsonl"),
+        chunks_dir=str(ROOT / "data" / "chunks"),
     )
-    if result.returncode != 0:
-        print(result.stderr or result.stdout, file=sys.stderr)
+
+
+def _run_embedding_pipeline(pipeline: EmbeddingPipeline) -> dict:
+    """Run the embedding pipeline over all chunk files. Returns summary dict."""
+    try:
+        summary = pipeline.run_for_all()
+    except Exception as e:
+        print(f"Embedding pipeline raised: {e}", file=sys.stderr)
         return {"embedded": -1, "skipped": 0, "errors": 1}
-    # Last line is "embedded=N skipped=M errors=E"
-    line = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
-    summary = {"embedded": 0, "skipped": 0, "errors": 0}
-    for part in line.split():
-        if "=" in part:
-            k, v = part.split("=", 1)
-            try:
-                summary[k] = int(v)
-            except ValueError:
-                pass
+    print(f"embedded={summary['embedded']} skipped={summary['skipped']} errors={summary['errors']}", file=sys.stderr)
     return summary
 
 
-def _verify_vector_store() -> tuple[int, bool]:
+def _verify_vector_store(store: ChromaVectorStore, pipeline: EmbeddingPipeline) -> tuple[int, bool]:
     """Check vector store count and idempotency (run embed again, expect skips). Returns (count, idempotency_ok)."""
-    sys.path.insert(0, str(ROOT))
-    from vector_store import ChromaVectorStore
-
-    store = ChromaVectorStore(persist_dir=str(ROOT / "data" / "vector_store"))
     count = store.count()
     if count == 0:
         return 0, False
 
     # Second run: should skip all
-    summary2 = _run_embedding_pipeline()
+    summary2 = _run_embedding_pipeline(pipeline)
     idempotency_ok = summary2.get("embedded", -1) == 0 and summary2.get("skipped", 0) >= 1
     return count, idempotency_ok
 
@@ -164,16 +218,28 @@ def _verify_vector_store() -> tuple[int, bool]:
 def main() -> int:
     parser = argparse.ArgumentParser(description="Run full pipeline to vector DB and verify.")
     parser.add_argument("--path", type=str, help="Optional: path to file to ingest (e.g. PDF) before embedding.")
+    parser.add_argument(
+        "--paths",
+        nargs="+",
+        default=None,
+        help=f"Optional: several files to ingest concurrently (limit via {LOAD_THREADS_ENV}).",
+    )
     parser.add_argument("--no-skip", action="store_true", help="Re-ingest even if file was already processed (ignore sync state).")
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
 
-    if args.path:
-        path = Path(args.path)
-        if not path.exists():
-            print(f"Path not found: {path}", file=sys.stderr)
-            return 1
-        print("Running ingestion...", file=sys.stderr)
-        if not _run_ingestion(str(path.resolve()), no_skip=args.no_skip):
+    paths = _resolve_paths(([args.path] if args.path else []) + (args.paths or []))
+    if paths is None:
+        return 1
+    # Stages resolve data/ relative to the working directory, like their CLI modules run from ROOT
+    os.chdir(ROOT)
+    if paths:
+        if len(paths) == 1:
+            print("Running ingestion...", file=sys.stderr)
+            ok = _run_ingestion(paths[0], no_skip=args.no_skip)
+        else:
+            ok = _run_ingestion_many(paths, no_skip=args.no_skip)
+        if not ok:
             print("Ingestion produced no chunks or failed.", file=sys.stderr)
             # Fall back to test chunks
             _ensure_test_chunks()
@@ -183,14 +249,21 @@ def main() -> int:
             print("No chunk files in data/chunks and no --path provided.", file=sys.stderr)
             return 1
 
-    print("Running embedding pipeline (--all)...", file=sys.stderr)
-    summary = _run_embedding_pipeline()
+    print("Running embedding pipeline...", file=sys.stderr)
+    try:
+        store = _open_vector_store()
+        pipeline = _build_embedding_pipeline(store)
+    except Exception:
+        logger.exception("Could not set up the embedding pipeline")
+        print("Embedding pipeline failed.", file=sys.stderr)
+        return 1
+    summary = _run_embedding_pipeline(pipeline)
     if summary.get("errors", 0) > 0 and summary.get("embedded", 0) == 0:
         print("Embedding pipeline failed.", file=sys.stderr)
         return 1
 
     print("Verifying vector store...", file=sys.stderr)
-    count, idempotency_ok = _verify_vector_store()
+    count, idempotency_ok = _verify_vector_store(store, pipeline)
     print(f"Vector store count: {count}", file=sys.stderr)
     print(f"Idempotency (second run skips): {idempotency_ok}", file=sys.stderr)
 
@@ -1,7 +1,8 @@
 """Business orchestration layer between API and graph. No service logic in API or agents."""
 
 from services.rag_service import RAGService
+from services.results import EMPTY_QA_RESULT, QAResult
 from services.agent_service import AgentService
 from services.workflow_service import WorkflowService
 
-__all__ = ["RAGService", "AgentService", "WorkflowService"]
+__all__ = ["EMPTY_QA_RESULT", "QAResult", "RAGService", "AgentService", "WorkflowService"]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from services.results import EMPTY_QA_RESULT, QAResult
+
 
 class AgentService:
     """Orchestrates role-based agents (retrieval, validation, report, QA). Thin layer over agents/."""
@@ -24,6 +26,6 @@ class AgentService:
         """Run report agent. Stub for now."""
         return {"report": ""}
 
-    def run_qa(self, question: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    def run_qa(self, question: str, context: dict[str, Any] | None = None) -> QAResult:
         """Run QA agent. Stub for now."""
-        return {"answer": "", "citations": []}
+        return EMPTY_QA_RESULT
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from services.results import EMPTY_QA_RESULT, QAResult
+
 
 class RAGService:
     """Orchestrates retrieval, prompt build, and generation. Thin layer over rag/ components."""
@@ -12,13 +14,9 @@ class RAGService:
         """Initialize with retriever, prompt builder, generator (injected later)."""
         pass
 
-    def query(self, question: str, *, top_k: int = 5) -> dict[str, Any]:
+    def query(self, question: str, *, top_k: int = 5) -> QAResult:
         """Run RAG: retrieve, build prompt, generate answer with citations. Stub for now."""
-        return {
-            "answer": "",
-            "citations": [],
-            "confidence": 0.0,
-        }
+        return EMPTY_QA_RESULT
 
     def ingest(self, paths: list[str], *, batch: bool = True) -> dict[str, Any]:
         """Trigger ingestion for given paths. Delegates to pipelines/. Stub for now."""
@@ -0,0 +1,19 @@
+"""Result types shared by the services (no service depends on another for them)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class QAResult:
+    """Answer with citations returned by RAG and QA calls. Immutable, so empty results can be shared."""
+
+    answer: str = ""
+    citations: tuple[dict[str, Any], ...] = ()
+    confidence: float = 0.0
+
+
+# The one empty result returned by the RAG and QA stubs (shared; QAResult is immutable)
+EMPTY_QA_RESULT = QAResult()
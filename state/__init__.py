@@ -1,6 +1,8 @@
 """Sync state: per-source progress and unit-level checkpoint for restart-safe ingestion."""
 
+from state.async_loader import load_all_state
 from state.sync_state import (
+    compact_sync_state,
     load_sync_state,
     save_sync_state,
     update_sync_state,
@@ -9,17 +11,21 @@ from state.sync_state import (
 from state.unit_progress import (
     load_unit_progress,
     save_unit_progress,
+    set_unit_progress,
     update_unit_progress,
     UnitProgressRecord,
 )
 
 __all__ = [
     "SyncStateRecord",
+    "compact_sync_state",
+    "load_all_state",
     "load_sync_state",
     "save_sync_state",
     "update_sync_state",
     "UnitProgressRecord",
     "load_unit_progress",
     "save_unit_progress",
+    "set_unit_progress",
     "update_unit_progress",
 ]
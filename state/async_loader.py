@@ -0,0 +1,27 @@
+"""Load the ingestion state files concurrently for asyncio callers."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from state.sync_state import SyncStateRecord, load_sync_state
+from state.unit_progress import UnitProgressRecord, load_unit_progress
+
+
+async def load_all_state(
+    sync_path: Path | None = None,
+    progress_path: Path | None = None,
+) -> tuple[dict[str, SyncStateRecord], dict[str, UnitProgressRecord]]:
+    """
+    Load sync state and unit progress at the same time; return (sync_state, unit_progress).
+
+    Each loader runs in a worker thread, so slow disks or network filesystems
+    cost one read latency instead of two and the event loop is never blocked.
+    Sync callers can use asyncio.run(load_all_state()).
+    """
+    sync_state, unit_progress = await asyncio.gather(
+        asyncio.to_thread(load_sync_state, sync_path),
+        asyncio.to_thread(load_unit_progress, progress_path),
+    )
+    return sync_state, unit_progress
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from storage.file_lock import atomic_write_bytes, file_lock
+from storage.json_io import json_dumps, json_loads
+
 STATE_DIR = Path("data/state")
 STATE_FILE = STATE_DIR / "sync_state.json"
 
@@ -33,23 +36,64 @@ def _serialize_dt(dt: datetime | None) -> str | None:
 
 
 def _deserialize_dt(s: str | None) -> datetime | None:
-    """Deserialize ISO string to datetime."""
-    if not s:
-        return None
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    """Deserialize ISO string to datetime (fromisoformat is C and accepts a trailing Z on 3.11+)."""
+    return datetime.fromisoformat(s) if s else None
+
+
+def _log_path(p: Path) -> Path:
+    """Append-only update log next to the state file: replayed on load, cleared on save."""
+    return p.with_name(p.stem + ".log.jsonl")
+
+
+def _merge(
+    state: dict[str, SyncStateRecord],
+    source_uri: str,
+    last_checksum: str | None,
+    last_processed_at: datetime | None,
+    status: str | None,
+) -> None:
+    """Apply one update to state in place; None fields keep the previous value."""
+    rec = state.get(
+        source_uri,
+        SyncStateRecord(source_uri=source_uri, last_checksum=None, last_processed_at=None, status="pending"),
+    )
+    state[source_uri] = SyncStateRecord(
+        source_uri=source_uri,
+        last_checksum=last_checksum if last_checksum is not None else rec.last_checksum,
+        last_processed_at=last_processed_at if last_processed_at is not None else rec.last_processed_at,
+        status=status if status is not None else rec.status,
+    )
+
+
+def _replay_log(state: dict[str, SyncStateRecord], p: Path) -> None:
+    """Apply updates from the append log in order; skip a torn last line left by a crash."""
+    try:
+        lines = _log_path(p).read_bytes().splitlines()
+    except OSError:
+        return
+    for line in lines:
+        try:
+            upd = json_loads(line)
+        except ValueError:
+            continue
+        if isinstance(upd, dict) and isinstance(upd.get("source_uri"), str):
+            _merge(
+                state,
+                upd["source_uri"],
+                upd.get("last_checksum"),
+                _deserialize_dt(upd.get("last_processed_at")),
+                upd.get("status"),
+            )
 
 
 def load_sync_state(path: Path | None = None) -> dict[str, SyncStateRecord]:
-    """Load sync state from JSON; return dict source_uri -> SyncStateRecord."""
+    """Load sync state from JSON plus its update log; return dict source_uri -> SyncStateRecord."""
     p = path if path is not None else STATE_FILE
-    if not p.exists():
-        return {}
-    try:
-        with open(p, encoding="utf-8") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return {}
     result: dict[str, SyncStateRecord] = {}
+    try:
+        data = json_loads(p.read_bytes())
+    except (ValueError, OSError):
+        data = {}
     for uri, rec in data.items():
         if isinstance(rec, dict):
             result[uri] = SyncStateRecord(
@@ -58,13 +102,12 @@ def load_sync_state(path: Path | None = None) -> dict[str, SyncStateRecord]:
                 last_processed_at=_deserialize_dt(rec.get("last_processed_at")),
                 status=rec.get("status", "pending"),
             )
+    _replay_log(result, p)
     return result
 
 
-def save_sync_state(state: dict[str, SyncStateRecord], path: Path | None = None) -> None:
-    """Persist sync state to JSON."""
-    _ensure_state_dir()
-    p = path if path is not None else STATE_FILE
+def _write_state(state: dict[str, SyncStateRecord], p: Path) -> None:
+    """Atomically replace the state file with state and clear the update log (caller holds the lock)."""
     data = {
         uri: {
             "source_uri": r.source_uri,
@@ -74,8 +117,22 @@ def save_sync_state(state: dict[str, SyncStateRecord], path: Path | None = None)
         }
         for uri, r in state.items()
     }
-    with open(p, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    atomic_write_bytes(p, json_dumps(data))
+    _log_path(p).unlink(missing_ok=True)
+
+
+def save_sync_state(state: dict[str, SyncStateRecord], path: Path | None = None) -> None:
+    """
+    Persist sync state to JSON and clear the update log (state now includes it).
+
+    Replaces the whole state: log entries appended by other processes since state
+    was loaded are dropped. Concurrent writers should use update_sync_state and
+    compact_sync_state instead.
+    """
+    _ensure_state_dir()
+    p = path if path is not None else STATE_FILE
+    with file_lock(p):
+        _write_state(state, p)
 
 
 def update_sync_state(
@@ -85,17 +142,40 @@ def update_sync_state(
     status: str | None = None,
     path: Path | None = None,
 ) -> None:
-    """Update one source's record and save. Load, update, save."""
-    state = load_sync_state(path)
-    rec = state.get(
-        source_uri,
-        SyncStateRecord(source_uri=source_uri, last_checksum=None, last_processed_at=None, status="pending"),
-    )
-    rec = SyncStateRecord(
-        source_uri=rec.source_uri,
-        last_checksum=last_checksum if last_checksum is not None else rec.last_checksum,
-        last_processed_at=last_processed_at if last_processed_at is not None else rec.last_processed_at,
-        status=status if status is not None else rec.status,
-    )
-    state[source_uri] = rec
-    save_sync_state(state, path)
+    """
+    Record one source's update by appending a line to the update log.
+
+    O(1) per call: the state file is not re-read or rewritten. None fields keep
+    their previous value when the log is replayed by load_sync_state.
+    """
+    _ensure_state_dir()
+    p = path if path is not None else STATE_FILE
+    upd: dict[str, str] = {"source_uri": source_uri}
+    if last_checksum is not None:
+        upd["last_checksum"] = last_checksum
+    if last_processed_at is not None:
+        upd["last_processed_at"] = last_processed_at.isoformat()
+    if status is not None:
+        upd["status"] = status
+    line = json_dumps(upd) + b"\n"
+    # Locked so the append cannot land between a compaction's read and its log unlink
+    with file_lock(p):
+        fd = os.open(_log_path(p), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+
+def compact_sync_state(path: Path | None = None) -> None:
+    """
+    Fold the update log into the state file (call at the end of a run).
+
+    Read, rewrite and log unlink happen under the state file's lock, so updates
+    appended by other ingestion processes are either folded in or kept in the log.
+    """
+    p = path if path is not None else STATE_FILE
+    if not _log_path(p).exists():
+        return
+    with file_lock(p):
+        _write_state(load_sync_state(p), p)
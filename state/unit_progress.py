@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from storage.file_lock import atomic_write_bytes, file_lock
+from storage.json_io import json_dumps, json_loads
+
 STATE_DIR = Path("data/state")
 UNIT_PROGRESS_FILE = STATE_DIR / "unit_progress.json"
 
@@ -31,9 +34,7 @@ def _serialize_dt(dt: datetime | None) -> str | None:
 
 
 def _deserialize_dt(s: str | None) -> datetime | None:
-    if not s:
-        return None
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    return datetime.fromisoformat(s) if s else None
 
 
 def load_unit_progress(path: Path | None = None) -> dict[str, UnitProgressRecord]:
@@ -42,9 +43,8 @@ def load_unit_progress(path: Path | None = None) -> dict[str, UnitProgressRecord
     if not p.exists():
         return {}
     try:
-        with open(p, encoding="utf-8") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError):
+        data = json_loads(p.read_bytes())
+    except (ValueError, OSError):
         return {}
     result: dict[str, UnitProgressRecord] = {}
     for doc_id, rec in data.items():
@@ -58,10 +58,8 @@ def load_unit_progress(path: Path | None = None) -> dict[str, UnitProgressRecord
     return result
 
 
-def save_unit_progress(progress: dict[str, UnitProgressRecord], path: Path | None = None) -> None:
-    """Persist unit progress to JSON."""
-    _ensure_state_dir()
-    p = path if path is not None else UNIT_PROGRESS_FILE
+def _encode(progress: dict[str, UnitProgressRecord]) -> bytes:
+    """Serialize progress to the unit_progress.json layout."""
     data = {
         doc_id: {
             "doc_id": r.doc_id,
@@ -71,27 +69,55 @@ def save_unit_progress(progress: dict[str, UnitProgressRecord], path: Path | Non
         }
         for doc_id, r in progress.items()
     }
-    with open(p, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    return json_dumps(data)
 
 
-def update_unit_progress(
+def save_unit_progress(
+    progress: dict[str, UnitProgressRecord],
+    path: Path | None = None,
+    doc_ids: Iterable[str] | None = None,
+) -> None:
+    """
+    Persist unit progress to JSON.
+
+    With doc_ids, only those docs' records are merged into a fresh read of the
+    file, so checkpoints saved meanwhile by other processes are kept; without
+    it the file is replaced by progress. Either way the read-modify-write runs
+    under the file's lock and the file is renamed into place, never truncated.
+    """
+    _ensure_state_dir()
+    p = path if path is not None else UNIT_PROGRESS_FILE
+    with file_lock(p):
+        if doc_ids is not None:
+            merged = load_unit_progress(p)
+            merged.update({doc_id: progress[doc_id] for doc_id in doc_ids})
+            progress = merged
+        atomic_write_bytes(p, _encode(progress))
+
+
+def set_unit_progress(
+    progress: dict[str, UnitProgressRecord],
     doc_id: str,
     last_unit_index: int,
     last_checksum: str | None = None,
-    path: Path | None = None,
 ) -> None:
-    """Update one doc's unit progress and save."""
-    progress = load_unit_progress(path)
-    rec = progress.get(
-        doc_id,
-        UnitProgressRecord(doc_id=doc_id, last_unit_index=-1, last_checksum=None, updated_at=None),
-    )
-    rec = UnitProgressRecord(
+    """Update one doc's unit progress in an already-loaded progress dict (no file I/O)."""
+    prev = progress.get(doc_id)
+    progress[doc_id] = UnitProgressRecord(
         doc_id=doc_id,
         last_unit_index=last_unit_index,
-        last_checksum=last_checksum if last_checksum is not None else rec.last_checksum,
+        last_checksum=last_checksum if last_checksum is not None else (prev.last_checksum if prev else None),
         updated_at=datetime.now(),
     )
-    progress[doc_id] = rec
-    save_unit_progress(progress, path)
+
+
+def update_unit_progress(
+    doc_id: str,
+    last_unit_index: int,
+    last_checksum: str | None = None,
+    path: Path | None = None,
+) -> None:
+    """Update one doc's unit progress and save."""
+    progress = load_unit_progress(path)
+    set_unit_progress(progress, doc_id, last_unit_index, last_checksum)
+    save_unit_progress(progress, path, doc_ids=[doc_id])
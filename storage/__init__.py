@@ -1,8 +1,11 @@
 """Raw blob storage with content_ref and checksum index for restart-safe ingestion."""
 
+from storage.file_lock import atomic_write_bytes, file_lock
+from storage.json_io import json_dumps, json_loads
 from storage.parsed_unit_store import persist_parsed_units
 from storage.raw_store import (
     exists_by_checksum,
+    exists_by_checksums,
     load_raw_bytes,
     save_raw_bytes,
     RawStore,
@@ -13,5 +16,10 @@ __all__ = [
     "save_raw_bytes",
     "load_raw_bytes",
     "exists_by_checksum",
+    "exists_by_checksums",
     "persist_parsed_units",
+    "atomic_write_bytes",
+    "file_lock",
+    "json_dumps",
+    "json_loads",
 ]
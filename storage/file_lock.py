@@ -0,0 +1,48 @@
+"""Cross-process file helpers: an exclusive advisory lock and atomic whole-file writes."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - exercised only on Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+def lock_path_for(path: Path) -> Path:
+    """Sidecar lock file guarding path (e.g. sync_state.json -> sync_state.json.lock)."""
+    return path.with_name(path.name + ".lock")
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on the sidecar lock file of path for the duration of the block.
+
+    Advisory: only code that also takes this lock is excluded, so every writer of a
+    shared state file must go through it. Not reentrant; do not nest on the same path.
+    """
+    lock_path = lock_path_for(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover - exercised only on Windows
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a per-process temp file next to path, then rename it over path."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from schemas.parsed_unit import ParsedUnit
+from storage.file_lock import atomic_write_bytes
 
 PARSED_UNITS_DIR = Path("data/parsed_units")
+_UNIT_ADAPTER = TypeAdapter(ParsedUnit)
 
 
 def persist_parsed_units(doc_id: str, units: list[ParsedUnit], base_dir: Path | None = None) -> Path:
@@ -14,12 +18,11 @@ def persist_parsed_units(doc_id: str, units: list[ParsedUnit], base_dir: Path |
     Write ParsedUnits to data/parsed_units/<doc_id>.jsonl (one JSON object per line).
 
     Used for: debug extraction quality, retry failed units, evaluate chunking, audit trail.
+    Lines are serialized to bytes by pydantic-core and written with one write
+    to a temp file that is renamed into place.
     """
     directory = base_dir if base_dir is not None else PARSED_UNITS_DIR
     directory.mkdir(parents=True, exist_ok=True)
     path = directory / f"{doc_id}.jsonl"
-    with open(path, "w", encoding="utf-8") as f:
-        for u in units:
-            line = u.model_dump_json(mode="json") + "\n"
-            f.write(line)
+    atomic_write_bytes(path, b"".join(_UNIT_ADAPTER.dump_json(u) + b"\n" for u in units))
     return path
@@ -3,14 +3,90 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import logging
 import os
 import shutil
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
-CHUNK_SIZE = 65536  # 64 KiB for streaming copy
+from storage.file_lock import atomic_write_bytes, file_lock
+from storage.json_io import json_dumps, json_loads
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - exercised only without blake3
+    blake3 = None  # type: ignore[assignment]
+
+CHUNK_SIZE = 1 << 20  # 1 MiB for streaming copy
 INDEX_FILENAME = "checksum_index.json"
+# Append-only "<checksum>\t<content_ref>" lines written per save; folded into INDEX_FILENAME by flush()
+INDEX_LOG_FILENAME = "checksum_index.log.tsv"
+DEFAULT_INDEX_AUTOFLUSH = 256
+# sha256 checksums are bare hex (existing indexes); other algorithms are stored as "<algo>:<hex>"
+HASH_ALGORITHMS = ("sha256", "blake3")
+
+logger = logging.getLogger(__name__)
+
+
+def _new_sha256() -> hashlib._Hash:
+    """
+    Return a sha256 hasher via hashlib.new, which prefers OpenSSL over the builtin fallback.
+
+    OpenSSL dispatches to SHA-NI / ARMv8 SHA2 instructions when the CPU has them.
+    Checksums are for change detection and dedup, not security.
+    """
+    return hashlib.new("sha256", usedforsecurity=False)
+
+
+logger.debug("raw_store sha256 backend: %s", type(_new_sha256()).__module__)
+
+
+def _new_blake3() -> Any:
+    """Return a BLAKE3 hasher that may use the library's thread pool (SIMD tree hashing) on large inputs."""
+    return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+
+def _sendfile_copy(src: BinaryIO, dst: BinaryIO, offset: int) -> bool:
+    """
+    Copy src from offset to end into dst with os.sendfile (zero-copy, in the kernel).
+
+    Returns False when src has no real file descriptor or the platform rejects
+    sendfile to a regular file, so the caller can fall back to a userspace copy.
+    """
+    if not hasattr(os, "sendfile"):
+        return False
+    try:
+        in_fd = src.fileno()
+    except (AttributeError, OSError):
+        return False
+    try:
+        out_fd = dst.fileno()
+        while True:
+            sent = os.sendfile(out_fd, in_fd, offset, CHUNK_SIZE)
+            if sent == 0:
+                return True
+            offset += sent
+    except OSError:
+        return False
+
+
+def _digest_from(stream: BinaryIO, start: int, new_hasher: Callable[[], Any]) -> Any:
+    """
+    Hash a seekable stream from start to end; return the finished hasher.
+
+    In-memory buffers are hashed from a zero-copy view of the bytes after start
+    (hashlib.file_digest would hash the whole buffer, ignoring the position);
+    other streams go through hashlib.file_digest, which reads from the current
+    position.
+    """
+    getbuffer = getattr(stream, "getbuffer", None)
+    if getbuffer is None:
+        return hashlib.file_digest(stream, new_hasher)
+    hasher = new_hasher()
+    with getbuffer() as view, view[start:] as tail:
+        hasher.update(tail)
+    return hasher
 
 
 class RawStore:
@@ -19,32 +95,91 @@ class RawStore:
 
     Uses streaming write (chunked copy) to avoid loading entire content into memory.
     Stores blobs under base_path; maintains checksum -> content_ref index for
-    exists_by_checksum (restart-safe / skip-if-processed).
+    exists_by_checksum (restart-safe / skip-if-processed). hash_algorithm
+    "blake3" (needs the blake3 package) hashes much faster than sha256 but
+    yields different checksums, so every document looks changed once after
+    switching.
     """
 
-    def __init__(self, base_path: str | Path = "data/raw") -> None:
-        """Initialize store with base directory for blobs and index."""
+    def __init__(
+        self,
+        base_path: str | Path = "data/raw",
+        hash_algorithm: str = "sha256",
+        autoflush: int = DEFAULT_INDEX_AUTOFLUSH,
+    ) -> None:
+        """
+        Initialize store with base directory for blobs and index, and the checksum algorithm.
+
+        Each save appends one line to the index log; the JSON index is rewritten
+        only every autoflush saves or on flush().
+        """
+        if hash_algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"hash_algorithm must be one of {HASH_ALGORITHMS}, got {hash_algorithm!r}")
+        if hash_algorithm == "blake3" and blake3 is None:
+            logger.warning("blake3 not installed; raw store falls back to sha256 checksums")
+            hash_algorithm = "sha256"
+        self.hash_algorithm = hash_algorithm
+        # Copying a fresh hasher skips the per-file context setup (OpenSSL EVP init, BLAKE3 key setup)
+        template = _new_blake3() if hash_algorithm == "blake3" else _new_sha256()
+        self._new_hasher: Callable[[], Any] = template.copy
         self._base = Path(base_path)
         self._index_path = self._base / INDEX_FILENAME
-        self._index: dict[str, str] = {}
-        self._load_index()
+        self._index_log_path = self._base / INDEX_LOG_FILENAME
+        self._autoflush = max(1, autoflush)
+        self._unflushed = 0
+        self._index: dict[str, str] = self._read_index()
 
-    def _load_index(self) -> None:
-        """Load checksum -> content_ref index from disk if present."""
-        if self._index_path.exists():
-            try:
-                with open(self._index_path, encoding="utf-8") as f:
-                    self._index = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                self._index = {}
-        else:
-            self._index = {}
+    def _read_index(self) -> dict[str, str]:
+        """Return the on-disk checksum -> content_ref index with the index log replayed over it."""
+        try:
+            index = json_loads(self._index_path.read_bytes())
+        except (ValueError, OSError):
+            index = {}
+        try:
+            with open(self._index_log_path, encoding="utf-8") as f:
+                for line in f:
+                    checksum, sep, ref = line.rstrip("\n").partition("\t")
+                    if sep and ref:
+                        index[checksum] = ref
+        except OSError:
+            pass
+        return index
 
     def _save_index(self) -> None:
-        """Persist checksum index to disk."""
+        """Fold the index log into the JSON index on disk and drop the log.
+
+        Runs under the index lock and merges this store's entries into a fresh
+        read of the index and log, so entries saved by other processes (each
+        holding its own, possibly stale, in-memory index) are kept. The index is
+        renamed into place, so readers never see a partial file.
+        """
         self._base.mkdir(parents=True, exist_ok=True)
-        with open(self._index_path, "w", encoding="utf-8") as f:
-            json.dump(self._index, f, indent=2)
+        with file_lock(self._index_path):
+            merged = self._read_index()
+            merged.update(self._index)
+            atomic_write_bytes(self._index_path, json_dumps(merged))
+            self._index_log_path.unlink(missing_ok=True)
+        self._index = merged
+        self._unflushed = 0
+
+    def _append_index(self, checksum: str, content_ref: str) -> None:
+        """Record one index entry with a single O_APPEND write; compact every autoflush entries."""
+        self._index[checksum] = content_ref
+        # Locked so the append cannot land between another process's index read and log unlink
+        with file_lock(self._index_path):
+            fd = os.open(self._index_log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, f"{checksum}\t{content_ref}\n".encode("utf-8"))
+            finally:
+                os.close(fd)
+        self._unflushed += 1
+        if self._unflushed >= self._autoflush:
+            self._save_index()
+
+    def flush(self) -> None:
+        """Fold logged index entries into the JSON index (call after a batch of saves)."""
+        if self._unflushed:
+            self._save_index()
 
     def save_raw_bytes(
         self,
@@ -58,41 +193,85 @@ class RawStore:
 
         Uses chunked copy for streams to avoid full memory load. Registers
         checksum in index for exists_by_checksum. Caller gets checksum for records.
+        When the caller supplies checksum, content is not hashed again, so a
+        file-backed stream is copied entirely in the kernel.
         """
         self._base.mkdir(parents=True, exist_ok=True)
         blob_path = self._base / doc_id
-        hasher = hashlib.sha256()
 
         if isinstance(stream_or_bytes, bytes):
             blob_path.write_bytes(stream_or_bytes)
-            hasher.update(stream_or_bytes)
+            if checksum is None:
+                hasher = self._new_hasher()
+                hasher.update(stream_or_bytes)
+                checksum = self._checksum(hasher)
         else:
-            with open(blob_path, "wb") as out:
-                while True:
-                    chunk = stream_or_bytes.read(CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    out.write(chunk)
-                    hasher.update(chunk)
-
-        computed = hasher.hexdigest()
-        if checksum is None:
-            checksum = computed
-        self._index[checksum] = str(blob_path)
-        self._save_index()
+            computed = self._copy_stream(blob_path, stream_or_bytes, hash_content=checksum is None)
+            if checksum is None:
+                checksum = computed
+        self._append_index(checksum, str(blob_path))
         return (str(blob_path), checksum)
 
-    def load_raw_bytes(self, content_ref: str) -> bytes:
-        """Read content from path given by content_ref; return bytes."""
+    def _checksum(self, hasher: Any) -> str:
+        """Format a finished hasher as an index checksum (bare hex for sha256, "<algo>:<hex>" otherwise)."""
+        digest = hasher.hexdigest()
+        return digest if self.hash_algorithm == "sha256" else f"{self.hash_algorithm}:{digest}"
+
+    def _copy_stream(self, blob_path: Path, stream: BinaryIO, hash_content: bool = True) -> str | None:
+        """
+        Copy stream into blob_path; return its checksum (None when hash_content is False).
+
+        Seekable streams are hashed from their current position (skipped if not
+        hash_content), then copied in the kernel with os.sendfile when they are
+        backed by a real file descriptor (else with shutil.copyfileobj). Other
+        streams use a chunked read/hash/write loop.
+        """
+        if stream.seekable():
+            start = stream.tell()
+            computed = None
+            if hash_content:
+                computed = self._checksum(_digest_from(stream, start, self._new_hasher))
+                stream.seek(start)
+            with open(blob_path, "wb") as out:
+                if not _sendfile_copy(stream, out, start):
+                    stream.seek(start)
+                    out.seek(0)
+                    out.truncate()
+                    shutil.copyfileobj(stream, out, CHUNK_SIZE)
+            return computed
+        if not hash_content:
+            with open(blob_path, "wb") as out:
+                shutil.copyfileobj(stream, out, CHUNK_SIZE)
+            return None
+        hasher = self._new_hasher()
+        with open(blob_path, "wb") as out:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                out.write(chunk)
+                hasher.update(chunk)
+        return self._checksum(hasher)
+
+    def path_of(self, content_ref: str) -> Path:
+        """Resolve content_ref to the blob path on disk (relative refs resolve under base_path)."""
         path = Path(content_ref)
         if not path.is_absolute():
             path = self._base / path.name
-        return path.read_bytes()
+        return path
+
+    def load_raw_bytes(self, content_ref: str) -> bytes:
+        """Read content from path given by content_ref; return bytes."""
+        return self.path_of(content_ref).read_bytes()
 
     def exists_by_checksum(self, checksum: str) -> bool:
         """Return True if a blob is already stored for this checksum (restart-safe)."""
         return checksum in self._index
 
+    def exists_by_checksums(self, checksums: Iterable[str]) -> list[bool]:
+        """Batch form of exists_by_checksum: one membership flag per checksum, in order."""
+        return list(map(self._index.__contains__, checksums))
+
 
 _default_store: RawStore | None = None
 
@@ -129,3 +308,9 @@ def exists_by_checksum(checksum: str, store: RawStore | None = None) -> bool:
     """Return whether checksum is already stored. Uses default RawStore if store not provided."""
     s = store if store is not None else _get_default_store()
     return s.exists_by_checksum(checksum)
+
+
+def exists_by_checksums(checksums: Iterable[str], store: RawStore | None = None) -> list[bool]:
+    """Return whether each checksum is already stored. Uses default RawStore if store not provided."""
+    s = store if store is not None else _get_default_store()
+    return s.exists_by_checksums(checksums)
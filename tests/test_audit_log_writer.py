@@ -0,0 +1,38 @@
+"""Tests for AuditLogWriter: background appends coalesced by a single writer thread."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pipelines.audit_log_writer import AuditLogWriter
+
+
+def test_close_flushes_all_records_in_order(tmp_path: Path) -> None:
+    """Every enqueued line is on disk, in enqueue order, once close() returns."""
+    path = tmp_path / "nested" / "audit.jsonl"
+    with AuditLogWriter(path) as writer:
+        for i in range(500):
+            writer.enqueue(f"{i}\n".encode())
+    assert path.read_text(encoding="utf-8").splitlines() == [str(i) for i in range(500)]
+
+
+def test_appends_to_existing_file(tmp_path: Path) -> None:
+    """A new writer appends after existing content instead of truncating."""
+    path = tmp_path / "audit.jsonl"
+    path.write_bytes(b"old\n")
+    writer = AuditLogWriter(path)
+    writer.enqueue(b"new\n")
+    writer.close()
+    writer.close()
+    assert path.read_bytes() == b"old\nnew\n"
+
+
+def test_open_failures_are_logged_not_raised(tmp_path: Path) -> None:
+    """Nothing is created until a record arrives; an uncreatable path never raises to the caller."""
+    unused = tmp_path / "unused" / "audit.jsonl"
+    with AuditLogWriter(unused):
+        pass
+    assert not unused.parent.exists()
+    (tmp_path / "blocker").write_bytes(b"")
+    with AuditLogWriter(tmp_path / "blocker" / "audit.jsonl") as writer:
+        writer.enqueue(b"lost\n")
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import math
+import numpy as np
 import pytest
 
 from embeddings.bge_m3_embedder import BgeM3Embedder
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def embedder() -> BgeM3Embedder:
-    """BgeM3Embedder with small batch_size for tests. Uses GPU (cuda) if available."""
+    """BgeM3Embedder with small batch_size for tests, loaded once per session. Uses GPU (cuda) if available.
+
+    Tests only call embed_texts/vector_dim; its cache holds deterministic vectors, so sharing is safe.
+    """
     return BgeM3Embedder(model_name="BAAI/bge-m3", batch_size=4, normalize=True, device=None)
 
 
@@ -31,6 +34,5 @@ def test_normalized_vectors_have_unit_norm(embedder: BgeM3Embedder) -> None:
     texts = ["Unit norm check.", "Another short text."]
     vectors = embedder.embed_texts(texts)
     assert len(vectors) >= 1
-    for v in vectors:
-        norm = math.sqrt(sum(x * x for x in v))
-        assert abs(norm - 1.0) < 0.01, f"Expected norm ~1.0, got {norm}"
+    norms = np.linalg.norm(np.asarray(vectors, dtype=np.float32), axis=1)
+    assert np.allclose(norms, 1.0, atol=0.01), f"Expected norms ~1.0, got {norms}"
@@ -0,0 +1,27 @@
+"""Tests for EmbeddingCache: digest keys and LRU eviction. No model."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from embeddings.embedding_cache import EmbeddingCache
+
+
+def test_cache_key_is_stable_per_text() -> None:
+    """Same text gives the same key; different text gives a different key."""
+    assert EmbeddingCache.key("Page 1 of 10") == EmbeddingCache.key("Page 1 of 10")
+    assert EmbeddingCache.key("Page 1 of 10") != EmbeddingCache.key("Page 2 of 10")
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Beyond max_entries, the least recently used vector is evicted; get() refreshes recency."""
+    cache = EmbeddingCache(max_entries=2)
+    a, b, c = (EmbeddingCache.key(t) for t in ("a", "b", "c"))
+    cache.put(a, np.array([1.0]))
+    cache.put(b, np.array([2.0]))
+    assert cache.get(a) is not None
+    cache.put(c, np.array([3.0]))
+    assert len(cache) == 2
+    assert cache.get(b) is None
+    assert cache.get(a) is not None
+    assert cache.get(c) is not None
@@ -0,0 +1,275 @@
+"""Tests for EmbeddingPipeline with a fake embedder and in-memory vector store. No model or DB."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from embeddings.base import BaseEmbedder
+from pipelines.embedding_pipeline import EmbeddingPipeline
+from vector_store.base import BaseVectorStore
+
+
+class FakeEmbedder(BaseEmbedder):
+    """Deterministic 2-dim embedder that records each embed_texts batch size."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    @property
+    def vector_dim(self) -> int:
+        return 2
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(len(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+class MemoryVectorStore(BaseVectorStore):
+    """Dict-backed vector store for pipeline tests."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, tuple[list[float], dict]] = {}
+        self.add_sizes: list[int] = []
+
+    def add_embeddings(self, ids: list[str], vectors: list[list[float]], metadatas: list[dict]) -> None:
+        self.add_sizes.append(len(ids))
+        for id, vec, meta in zip(ids, vectors, metadatas):
+            self.items[id] = (vec, meta)
+
+    def has_id(self, id: str) -> bool:
+        return id in self.items
+
+    def delete_by_doc(self, doc_id: str) -> int:
+        ids = [i for i, (_, m) in self.items.items() if m["doc_id"] == doc_id]
+        for i in ids:
+            del self.items[i]
+        return len(ids)
+
+    def similarity_search(self, query_vector: list[float], k: int) -> list[dict]:
+        return []
+
+    def count(self) -> int:
+        return len(self.items)
+
+
+def _write_chunks(chunks_dir: Path, doc_id: str, n: int) -> None:
+    """Write n ChunkDocument dicts for doc_id to chunks_dir/<doc_id>.json."""
+    chunks_dir.mkdir(parents=True, exist_ok=True)
+    now = datetime.now(timezone.utc).isoformat()
+    chunks = [
+        {
+            "chunk_id": f"{doc_id}_c{i}",
+            "doc_id": doc_id,
+            "chunk_index": i,
+            "text": f"chunk {i} of {doc_id}",
+            "chunk_strategy": "recursive",
+            "source_uri": f"file:///{doc_id}.pdf",
+            "page_number": 1,
+            "created_at": now,
+        }
+        for i in range(n)
+    ]
+    (chunks_dir / f"{doc_id}.json").write_text(json.dumps(chunks), encoding="utf-8")
+
+
+@pytest.fixture
+def pipeline_parts(tmp_path: Path) -> tuple[EmbeddingPipeline, FakeEmbedder, MemoryVectorStore, Path]:
+    """Pipeline wired to a fake embedder, memory store, and tmp chunk/audit paths (batch_size=4)."""
+    embedder = FakeEmbedder()
+    store = MemoryVectorStore()
+    pipeline = EmbeddingPipeline(
+        embedder=embedder,
+        vector_store=store,
+        batch_size=4,
+        audit_log_path=str(tmp_path / "audit" / "records.jsonl"),
+        chunks_dir=str(tmp_path / "chunks"),
+    )
+    return pipeline, embedder, store, tmp_path
+
+
+def test_run_for_doc_embeds_and_is_idempotent(pipeline_parts) -> None:
+    """First run embeds every chunk and writes audit rows; second run skips them all."""
+    pipeline, _, store, tmp_path = pipeline_parts
+    _write_chunks(tmp_path / "chunks", "doc_a", 5)
+    assert pipeline.run_for_doc("doc_a") == {"embedded": 5, "skipped": 0, "errors": 0}
+    assert store.count() == 5
+    audit_lines = (tmp_path / "audit" / "records.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(audit_lines) == 5
+    assert pipeline.run_for_doc("doc_a") == {"embedded": 0, "skipped": 5, "errors": 0}
+
+
+def test_run_for_doc_missing_file_counts_error(pipeline_parts) -> None:
+    """A doc without a chunk file yields one error and embeds nothing."""
+    pipeline, _, store, _ = pipeline_parts
+    assert pipeline.run_for_doc("missing") == {"embedded": 0, "skipped": 0, "errors": 1}
+    assert store.count() == 0
+
+
+def test_run_for_all_batches_across_documents(pipeline_parts) -> None:
+    """Chunks from several small docs are packed into full batch_size embed calls."""
+    pipeline, embedder, store, tmp_path = pipeline_parts
+    for doc_id in ("doc_a", "doc_b", "doc_c"):
+        _write_chunks(tmp_path / "chunks", doc_id, 3)
+    assert pipeline.run_for_all() == {"embedded": 9, "skipped": 0, "errors": 0}
+    assert embedder.calls == [4, 4, 1]
+    assert store.count() == 9
+
+
+def test_load_chunks_rejects_non_array(pipeline_parts) -> None:
+    """A chunk file that is not a JSON array of chunks raises ValueError naming the file."""
+    pipeline, _, _, tmp_path = pipeline_parts
+    (tmp_path / "chunks").mkdir(parents=True)
+    (tmp_path / "chunks" / "bad.json").write_text('{"chunk_id": "x"}', encoding="utf-8")
+    with pytest.raises(ValueError, match="bad.json"):
+        pipeline.load_chunks("bad")
+
+
+def test_load_chunks_trusted_matches_validated(pipeline_parts) -> None:
+    """validate=False builds the same chunk ids, texts and created_at datetimes as the validating path."""
+    pipeline, _, _, tmp_path = pipeline_parts
+    _write_chunks(tmp_path / "chunks", "doc_a", 3)
+    trusted = pipeline.load_chunks("doc_a", validate=False)
+    validated = pipeline.load_chunks("doc_a")
+    assert [(c.chunk_id, c.text, c.created_at) for c in trusted] == [
+        (c.chunk_id, c.text, c.created_at) for c in validated
+    ]
+    assert isinstance(trusted[0].created_at, datetime)
+
+
+def test_trusted_run_for_all_counts_non_object_items_as_error(tmp_path: Path) -> None:
+    """With validate_chunks=False, a chunk file of non-objects is one error, not a crash."""
+    store = MemoryVectorStore()
+    pipeline = EmbeddingPipeline(
+        embedder=FakeEmbedder(),
+        vector_store=store,
+        batch_size=4,
+        audit_log_path=str(tmp_path / "audit" / "records.jsonl"),
+        chunks_dir=str(tmp_path / "chunks"),
+        validate_chunks=False,
+    )
+    _write_chunks(tmp_path / "chunks", "doc_a", 2)
+    (tmp_path / "chunks" / "doc_b.json").write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(ValueError, match="doc_b.json"):
+        pipeline.load_chunks("doc_b", validate=False)
+    assert pipeline.run_for_all() == {"embedded": 2, "skipped": 0, "errors": 1}
+
+
+@pytest.mark.parametrize("load_workers", [1, 3])
+def test_run_for_all_counts_bad_file_and_keeps_order(tmp_path: Path, load_workers: int) -> None:
+    """A broken chunk file is one error; other docs still embed in sorted doc order."""
+    embedder = FakeEmbedder()
+    store = MemoryVectorStore()
+    pipeline = EmbeddingPipeline(
+        embedder=embedder,
+        vector_store=store,
+        batch_size=4,
+        audit_log_path=str(tmp_path / "audit" / "records.jsonl"),
+        chunks_dir=str(tmp_path / "chunks"),
+        load_workers=load_workers,
+    )
+    for doc_id in ("doc_a", "doc_c", "doc_d"):
+        _write_chunks(tmp_path / "chunks", doc_id, 2)
+    (tmp_path / "chunks" / "doc_b.json").write_text("not json", encoding="utf-8")
+    assert pipeline.run_for_all() == {"embedded": 6, "skipped": 0, "errors": 1}
+    assert list(store.items) == [f"{d}_c{i}" for d in ("doc_a", "doc_c", "doc_d") for i in range(2)]
+
+
+def test_inflight_batches_store_in_order(tmp_path: Path) -> None:
+    """With several embed calls in flight, vectors still land in the store in chunk order."""
+    store = MemoryVectorStore()
+    pipeline = EmbeddingPipeline(
+        embedder=FakeEmbedder(),
+        vector_store=store,
+        batch_size=2,
+        audit_log_path=str(tmp_path / "audit" / "records.jsonl"),
+        chunks_dir=str(tmp_path / "chunks"),
+        max_inflight_batches=3,
+    )
+    _write_chunks(tmp_path / "chunks", "doc_a", 7)
+    assert pipeline.run_for_doc("doc_a") == {"embedded": 7, "skipped": 0, "errors": 0}
+    assert list(store.items) == [f"doc_a_c{i}" for i in range(7)]
+    audit = (tmp_path / "audit" / "records.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["chunk_id"] for line in audit] == list(store.items)
+
+
+def test_store_writes_are_buffered_across_embed_batches(tmp_path: Path) -> None:
+    """Embedded batches are written to the store store_batch_size rows at a time, plus a final flush."""
+    store = MemoryVectorStore()
+    pipeline = EmbeddingPipeline(
+        embedder=FakeEmbedder(),
+        vector_store=store,
+        batch_size=2,
+        audit_log_path=str(tmp_path / "audit" / "records.jsonl"),
+        chunks_dir=str(tmp_path / "chunks"),
+        store_batch_size=5,
+    )
+    _write_chunks(tmp_path / "chunks", "doc_a", 9)
+    assert pipeline.run_for_doc("doc_a") == {"embedded": 9, "skipped": 0, "errors": 0}
+    assert store.add_sizes == [6, 3]
+    assert list(store.items) == [f"doc_a_c{i}" for i in range(9)]
+
+
+def test_iter_chunks_matches_load_chunks(pipeline_parts) -> None:
+    """Streaming iteration yields the same chunks, in order, as the full load."""
+    pipeline, _, _, tmp_path = pipeline_parts
+    _write_chunks(tmp_path / "chunks", "doc_a", 6)
+    streamed = [c.chunk_id for c in pipeline.iter_chunks("doc_a")]
+    assert streamed == [c.chunk_id for c in pipeline.load_chunks("doc_a")]
+
+
+@pytest.mark.parametrize(("content", "validate"), [('{"not": "a list"}', True), ("[1, 2]", False)])
+def test_run_for_doc_counts_malformed_chunk_file_as_error(tmp_path: Path, content: str, validate: bool) -> None:
+    """An object root, or non-object items in trusted mode, is one error instead of a silent no-op or crash."""
+    pipeline = EmbeddingPipeline(
+        embedder=FakeEmbedder(),
+        vector_store=MemoryVectorStore(),
+        batch_size=4,
+        audit_log_path=str(tmp_path / "audit" / "records.jsonl"),
+        chunks_dir=str(tmp_path / "chunks"),
+        validate_chunks=validate,
+    )
+    (tmp_path / "chunks").mkdir(parents=True)
+    (tmp_path / "chunks" / "bad.json").write_text(content, encoding="utf-8")
+    assert pipeline.run_for_doc("bad") == {"embedded": 0, "skipped": 0, "errors": 1}
+
+
+def test_run_for_doc_does_not_swallow_store_value_errors(pipeline_parts) -> None:
+    """A ValueError from the vector store lookup propagates; only chunk-file errors are counted."""
+    pipeline, _, store, tmp_path = pipeline_parts
+    _write_chunks(tmp_path / "chunks", "doc_a", 2)
+
+    def fail(ids: list[str]) -> set[str]:
+        raise ValueError("store lookup exploded")
+
+    store.existing_ids = fail  # type: ignore[method-assign]
+    with pytest.raises(ValueError, match="store lookup exploded"):
+        pipeline.run_for_doc("doc_a")
+
+
+@pytest.mark.parametrize("max_inflight", [1, 2])
+def test_truncated_chunk_file_still_stores_embedded_rows(tmp_path: Path, max_inflight: int) -> None:
+    """Rows embedded before a chunk file turns out truncated are stored and audited, then the doc counts as an error."""
+    store = MemoryVectorStore()
+    pipeline = EmbeddingPipeline(
+        embedder=FakeEmbedder(),
+        vector_store=store,
+        batch_size=2,
+        audit_log_path=str(tmp_path / "audit" / "records.jsonl"),
+        chunks_dir=str(tmp_path / "chunks"),
+        max_inflight_batches=max_inflight,
+        store_batch_size=10,
+    )
+    _write_chunks(tmp_path / "chunks", "doc_a", 5)
+    path = tmp_path / "chunks" / "doc_a.json"
+    data = path.read_text(encoding="utf-8")
+    # Cut inside the last chunk: four complete items (two full batches), then EOF
+    path.write_text(data[: data.index('{"chunk_id": "doc_a_c4"') + 10], encoding="utf-8")
+    summary = pipeline.run_for_doc("doc_a")
+    assert list(store.items) == [f"doc_a_c{i}" for i in range(4)]
+    assert summary == {"embedded": 4, "skipped": 0, "errors": 1}
+    audit = (tmp_path / "audit" / "records.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(audit) == 4
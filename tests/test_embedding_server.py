@@ -0,0 +1,42 @@
+"""Tests for the embedding server app and HttpEmbedder, using a fake embedder. No model or network."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from api.embedding_server import create_embedding_app
+from embeddings.base import BaseEmbedder
+from embeddings.http_embedder import HttpEmbedder
+
+
+class CountingEmbedder(BaseEmbedder):
+    """2-dim embedder that counts how many times it was constructed and called."""
+
+    instances = 0
+
+    def __init__(self) -> None:
+        CountingEmbedder.instances += 1
+        self.calls: list[int] = []
+
+    @property
+    def vector_dim(self) -> int:
+        return 2
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(len(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+
+def test_http_embedder_round_trips_through_server() -> None:
+    """The embedder loads once at startup; batches are split client-side and order is preserved."""
+    CountingEmbedder.instances = 0
+    app = create_embedding_app(CountingEmbedder)
+    with TestClient(app) as client:
+        embedder = HttpEmbedder(batch_size=2, client=client)
+        vectors = embedder.embed_texts(["a", "bb", "ccc"])
+        assert embedder.vector_dim == 2
+        assert embedder.embed_texts([]) == []
+        served = app.state.embedder
+    assert vectors == [[1.0, 0.5], [2.0, 0.5], [3.0, 0.5]]
+    assert served.calls == [2, 1]
+    assert CountingEmbedder.instances == 1
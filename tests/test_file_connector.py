@@ -9,11 +9,16 @@ from schemas.source_record import SourceRecord
 from storage.raw_store import RawStore
 
 
-def test_file_connector_fetch_yields_source_record(tmp_path: Path) -> None:
+@pytest.fixture
+def store(tmp_path: Path) -> RawStore:
+    """Empty RawStore under the test's tmp dir (never the project's data/raw index)."""
+    return RawStore(base_path=tmp_path / "raw")
+
+
+def test_file_connector_fetch_yields_source_record(tmp_path: Path, store: RawStore) -> None:
     """Fetch from a small file yields one SourceRecord with content_ref and checksum."""
     f = tmp_path / "hello.txt"
     f.write_text("hello world")
-    store = RawStore(base_path=tmp_path / "raw")
     connector = FileConnector(raw_store=store)
     records = list(connector.fetch(f))
     assert len(records) == 1
@@ -29,20 +34,28 @@ def test_file_connector_fetch_yields_source_record(tmp_path: Path) -> None:
     assert raw == b"hello world"
 
 
-def test_file_connector_nonexistent_path_yields_nothing() -> None:
+def test_file_connector_nonexistent_path_yields_nothing(store: RawStore) -> None:
     """Fetch from nonexistent path yields no records."""
-    connector = FileConnector()
+    connector = FileConnector(raw_store=store)
     records = list(connector.fetch("/nonexistent/file.txt"))
     assert len(records) == 0
 
 
-def test_file_connector_checksum_stable(tmp_path: Path) -> None:
+def test_file_connector_checksum_stable(tmp_path: Path, store: RawStore) -> None:
     """Same content produces same checksum; content_ref stored."""
     f = tmp_path / "same.txt"
     f.write_text("same content")
-    store = RawStore(base_path=tmp_path / "raw")
     connector = FileConnector(raw_store=store)
     records = list(connector.fetch(f))
     assert len(records) == 1
     checksum = records[0].checksum
     assert store.exists_by_checksum(checksum)
+
+
+def test_file_connector_sniffs_pdf_without_extension(tmp_path: Path, store: RawStore) -> None:
+    """A PDF without a known extension is detected from its %PDF- header."""
+    f = tmp_path / "report"
+    f.write_bytes(b"%PDF-1.7\n%minimal\n")
+    connector = FileConnector(raw_store=store)
+    records = list(connector.fetch(f))
+    assert records[0].content_type == "application/pdf"
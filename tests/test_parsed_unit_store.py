@@ -0,0 +1,21 @@
+"""Tests for persist_parsed_units JSONL output."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from schemas.parsed_unit import ParsedUnit
+from storage.parsed_unit_store import persist_parsed_units
+
+
+def test_persist_parsed_units_writes_one_line_per_unit(tmp_path: Path) -> None:
+    """Each unit becomes one JSON line that validates back to the same ParsedUnit."""
+    now = datetime.now(timezone.utc)
+    units = [
+        ParsedUnit(doc_id="d", unit_index=i, unit_type="page", text=f"page {i} é", parse_status="success", created_at=now)
+        for i in range(3)
+    ]
+    path = persist_parsed_units("d", units, base_dir=tmp_path)
+    lines = path.read_bytes().splitlines()
+    assert [ParsedUnit.model_validate_json(line) for line in lines] == units
@@ -12,9 +12,9 @@ from schemas.source_document import SourceDocument
 from storage.raw_store import RawStore
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_pdf_bytes() -> bytes:
-    """Minimal PDF that pypdf can read (single empty or short page)."""
+    """Minimal PDF that pypdf can read (single empty or short page). Built once per module; bytes are immutable."""
     try:
         from pypdf import PdfWriter
 
@@ -0,0 +1,47 @@
+"""Tests for prefetch_iter: bounded producer thread feeding a consumer. No LLM."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from pipelines.prefetch import prefetch_iter
+
+
+def test_prefetch_iter_preserves_order() -> None:
+    """All items are yielded in producer order."""
+    assert list(prefetch_iter(range(50), maxsize=4)) == list(range(50))
+
+
+def test_prefetch_iter_reraises_producer_error() -> None:
+    """An exception in the producer surfaces in the consumer after earlier items."""
+
+    def failing() -> Iterator[int]:
+        yield 1
+        raise ValueError("boom")
+
+    it = prefetch_iter(failing())
+    assert next(it) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(it)
+
+
+def test_prefetch_iter_early_close_stops_producer() -> None:
+    """Closing the consumer early lets the producer thread exit instead of blocking on a full queue."""
+    finished = threading.Event()
+
+    def endless() -> Iterator[int]:
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            finished.set()
+
+    it = prefetch_iter(endless(), maxsize=2)
+    assert next(it) == 0
+    it.close()
+    assert finished.wait(timeout=2.0)
@@ -0,0 +1,116 @@
+"""Tests for RawStore checksums across bytes, seekable, and non-seekable inputs."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+
+from storage.raw_store import RawStore
+
+DATA = b"raw store payload " * 10_000
+
+
+class _Unseekable(io.RawIOBase):
+    """Read-only stream that refuses seek, like a pipe or socket."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buf = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:  # type: ignore[no-untyped-def]
+        return self._buf.readinto(b)
+
+
+def test_sha256_checksum_is_bare_hex(tmp_path: Path) -> None:
+    """Default checksums stay plain sha256 hex so existing indexes remain valid."""
+    store = RawStore(base_path=tmp_path)
+    _, checksum = store.save_raw_bytes("doc", DATA)
+    assert checksum == hashlib.sha256(DATA).hexdigest()
+    assert store.exists_by_checksum(checksum)
+
+
+def test_blake3_checksum_same_for_all_input_kinds(tmp_path: Path) -> None:
+    """blake3 checksums are prefixed and identical for bytes, file, and unseekable stream input."""
+    pytest.importorskip("blake3")
+    store = RawStore(base_path=tmp_path / "raw", hash_algorithm="blake3")
+    src = tmp_path / "src.bin"
+    src.write_bytes(DATA)
+    _, from_bytes = store.save_raw_bytes("a", DATA)
+    with open(src, "rb") as f:
+        ref, from_file = store.save_raw_bytes("b", f)
+    _, from_pipe = store.save_raw_bytes("c", _Unseekable(DATA))
+    assert from_bytes.startswith("blake3:")
+    assert from_bytes == from_file == from_pipe
+    assert store.load_raw_bytes(ref) == DATA
+
+
+def test_unknown_hash_algorithm_rejected(tmp_path: Path) -> None:
+    """Unsupported algorithms raise ValueError."""
+    with pytest.raises(ValueError):
+        RawStore(base_path=tmp_path, hash_algorithm="md5")
+
+
+def test_supplied_checksum_is_indexed_without_rehashing(tmp_path: Path) -> None:
+    """A caller-supplied checksum is stored as-is and the blob is still copied in full."""
+    store = RawStore(base_path=tmp_path / "raw")
+    src = tmp_path / "src.bin"
+    src.write_bytes(DATA)
+    with open(src, "rb") as f:
+        ref, checksum = store.save_raw_bytes("doc", f, checksum="precomputed")
+    assert checksum == "precomputed"
+    assert store.exists_by_checksum("precomputed")
+    assert store.load_raw_bytes(ref) == DATA
+    _, piped = store.save_raw_bytes("pipe", _Unseekable(DATA), checksum="piped")
+    assert piped == "piped"
+    assert store.load_raw_bytes(str(tmp_path / "raw" / "pipe")) == DATA
+
+
+
+def test_partly_consumed_stream_checksum_matches_stored_bytes(tmp_path: Path) -> None:
+    """A BytesIO positioned past a header stores and hashes only the bytes from that position."""
+    store = RawStore(base_path=tmp_path)
+    stream = io.BytesIO(b"HEADER" + DATA)
+    stream.seek(6)
+    ref, checksum = store.save_raw_bytes("src", stream)
+    assert store.load_raw_bytes(ref) == DATA
+    assert checksum == hashlib.sha256(DATA).hexdigest()
+
+def test_index_log_survives_reload_and_flush_compacts(tmp_path: Path) -> None:
+    """Saves are visible to a new store before flush; flush folds the log into the JSON index."""
+    base = tmp_path / "raw"
+    store = RawStore(base_path=base, autoflush=1000)
+    _, c1 = store.save_raw_bytes("a", b"one")
+    _, c2 = store.save_raw_bytes("b", b"two")
+    assert not (base / "checksum_index.json").exists()
+    reopened = RawStore(base_path=base)
+    assert reopened.exists_by_checksum(c1) and reopened.exists_by_checksum(c2)
+    store.flush()
+    assert not (base / "checksum_index.log.tsv").exists()
+    assert RawStore(base_path=base).exists_by_checksum(c2)
+
+
+
+def test_flush_keeps_entries_saved_by_other_stores(tmp_path: Path) -> None:
+    """A store flushing its stale index merges, not overwrites, entries logged by another store."""
+    base = tmp_path / "raw"
+    first = RawStore(base_path=base, autoflush=1000)
+    second = RawStore(base_path=base, autoflush=1000)
+    _, c1 = first.save_raw_bytes("a", b"one")
+    _, c2 = second.save_raw_bytes("b", b"two")
+    first.flush()
+    _, c3 = first.save_raw_bytes("c", b"three")
+    second.flush()
+    reopened = RawStore(base_path=base)
+    assert reopened.exists_by_checksums([c1, c2, c3]) == [True, True, True]
+
+def test_exists_by_checksums_matches_single_lookups(tmp_path: Path) -> None:
+    """The batch lookup returns one flag per checksum, in input order."""
+    store = RawStore(base_path=tmp_path)
+    _, c1 = store.save_raw_bytes("a", b"one")
+    assert store.exists_by_checksums([c1, "missing", c1]) == [True, False, True]
+    assert store.exists_by_checksums([]) == []
@@ -13,19 +13,30 @@ from schemas.parsed_unit import ParsedUnit
 @pytest.fixture
 def small_unit() -> ParsedUnit:
     """One ParsedUnit with short text."""
-    return ParsedUnit(
+    return _unit(
+        "First sentence. Second sentence. Third sentence.",
         doc_id="doc1",
-        unit_index=0,
-        unit_type="page",
-        text="First sentence. Second sentence. Third sentence.",
-        structure=None,
         metadata={"page_number": 1, "source_uri": "file:///test.txt"},
-        parse_status="success",
-        error=None,
-        created_at=datetime.now(timezone.utc),
     )
 
 
+def _unit(text: str, **overrides: object) -> ParsedUnit:
+    """ParsedUnit with the given text; keyword overrides replace the defaults."""
+    fields: dict[str, object] = {
+        "doc_id": "d1",
+        "unit_index": 0,
+        "unit_type": "page",
+        "text": text,
+        "structure": None,
+        "metadata": {},
+        "parse_status": "success",
+        "error": None,
+        "created_at": datetime.now(timezone.utc),
+    }
+    fields.update(overrides)
+    return ParsedUnit(**fields)
+
+
 def test_recursive_chunker_returns_chunk_documents(small_unit: ParsedUnit) -> None:
     """chunk(unit) returns list of ChunkDocument with chunk_strategy=recursive and RAG metadata."""
     chunker = RecursiveChunker(chunk_size=1000, overlap=0)
@@ -43,17 +54,7 @@ def test_recursive_chunker_returns_chunk_documents(small_unit: ParsedUnit) -> No
 
 def test_recursive_chunker_splits_large_text() -> None:
     """Large text is split into multiple chunks when chunk_size is small."""
-    unit = ParsedUnit(
-        doc_id="d1",
-        unit_index=0,
-        unit_type="block",
-        text="A. " * 200,
-        structure=None,
-        metadata={"source_uri": "file:///big.txt"},
-        parse_status="success",
-        error=None,
-        created_at=datetime.now(timezone.utc),
-    )
+    unit = _unit("A. " * 200, unit_type="block", metadata={"source_uri": "file:///big.txt"})
     chunker = RecursiveChunker(chunk_size=100, overlap=10)
     chunks = chunker.chunk(unit)
     assert len(chunks) >= 2
@@ -64,23 +65,48 @@ def test_recursive_chunker_splits_large_text() -> None:
 
 def test_recursive_chunker_empty_text_returns_empty_list() -> None:
     """Unit with no text yields no chunks."""
-    unit = ParsedUnit(
-        doc_id="d1",
-        unit_index=0,
-        unit_type="page",
-        text="",
-        structure=None,
-        metadata={},
-        parse_status="success",
-        error=None,
-        created_at=datetime.now(timezone.utc),
-    )
+    unit = _unit("")
     chunker = RecursiveChunker()
     assert chunker.chunk(unit) == []
 
 
 def test_registry_get_recursive_chunker() -> None:
-    """get_chunker('recursive') returns RecursiveChunker instance."""
+    """get_chunker('recursive') returns a RecursiveChunker, shared across identical calls."""
     chunker = get_chunker("recursive", chunk_size=500)
     assert isinstance(chunker, RecursiveChunker)
     assert chunker.chunk_size == 500
+    assert get_chunker("recursive", chunk_size=500) is chunker
+    assert get_chunker("recursive", chunk_size=600) is not chunker
+    assert get_chunker("recursive", separators=["\n", ""]) is not get_chunker("recursive", separators=["\n", ""])
+
+
+def test_recursive_chunker_keeps_paragraphs_that_fit_whole() -> None:
+    """Paragraphs shorter than chunk_size are not split further by lower-ranked separators."""
+    text = "Alpha beta gamma.\nDelta epsilon.\n\n" + "word " * 60
+    unit = _unit(text)
+    chunker = RecursiveChunker(chunk_size=100, overlap=0)
+    chunks = chunker.chunk(unit)
+    assert chunks[0].text.startswith("Alpha beta gamma.\nDelta epsilon.")
+    assert all(len(c.text) <= 100 for c in chunks)
+
+
+def test_recursive_chunker_hard_cuts_unbroken_text() -> None:
+    """Text without any separator is cut into chunk_size windows by the empty separator."""
+    unit = _unit("x" * 450, unit_type="block")
+    chunker = RecursiveChunker(chunk_size=100, overlap=0)
+    chunks = chunker.chunk(unit)
+    assert len(chunks) == 5
+    assert all(len(c.text) <= 100 for c in chunks)
+    assert "".join(c.text for c in chunks) == "x" * 450
+
+
+def test_recursive_chunker_overlap_carries_tail_of_previous_chunk() -> None:
+    """With overlap, each chunk starts with the tail of the previous one and stays within chunk_size."""
+    unit = _unit(" ".join(f"w{i}" for i in range(200)), unit_type="block")
+    chunker = RecursiveChunker(chunk_size=100, overlap=20)
+    chunks = chunker.chunk(unit)
+    assert len(chunks) >= 2
+    assert all(len(c.text) <= 100 for c in chunks)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        head = nxt.text.split(" ")[0]
+        assert head in prev.text[-20:]
@@ -0,0 +1,74 @@
+"""Tests for sync state: append-log updates, replay on load, compaction, concurrent writers and loading."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from state.async_loader import load_all_state
+from state.sync_state import compact_sync_state, load_sync_state, update_sync_state
+from state.unit_progress import save_unit_progress, set_unit_progress
+
+
+def test_updates_replay_and_merge_without_rewriting_state(tmp_path: Path) -> None:
+    """Updates append to the log; load merges them, keeping fields not given in later updates."""
+    path = tmp_path / "sync_state.json"
+    when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    update_sync_state("file:///a", last_checksum="c1", last_processed_at=when, status="processed", path=path)
+    update_sync_state("file:///a", status="failed", path=path)
+    update_sync_state("file:///b", last_checksum="c2", path=path)
+    assert not path.exists()
+    state = load_sync_state(path)
+    assert state["file:///a"].last_checksum == "c1"
+    assert state["file:///a"].last_processed_at == when
+    assert state["file:///a"].status == "failed"
+    assert state["file:///b"].status == "pending"
+
+
+def test_compact_folds_log_into_state_file(tmp_path: Path) -> None:
+    """compact_sync_state writes the merged state and removes the log; a torn log line is ignored."""
+    path = tmp_path / "sync_state.json"
+    update_sync_state("file:///a", last_checksum="c1", status="processed", path=path)
+    with open(tmp_path / "sync_state.log.jsonl", "ab") as f:
+        f.write(b'{"source_uri": "file:///a", "sta')
+    before = load_sync_state(path)
+    compact_sync_state(path)
+    assert not (tmp_path / "sync_state.log.jsonl").exists()
+    assert load_sync_state(path) == before
+
+
+
+def _update_and_compact(path: Path, worker: int, n: int) -> None:
+    """Worker for the multi-process test: append n updates, compacting after every few."""
+    for i in range(n):
+        update_sync_state(f"file:///w{worker}/{i}", status="processed", path=path)
+        if i % 5 == 4:
+            compact_sync_state(path)
+
+
+def test_concurrent_writers_and_compaction_lose_no_updates(tmp_path: Path) -> None:
+    """Updates appended by other processes while one compacts are never dropped."""
+    path = tmp_path / "sync_state.json"
+    workers, n = 4, 40
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        list(executor.map(_update_and_compact, [path] * workers, range(workers), [n] * workers))
+    compact_sync_state(path)
+    state = load_sync_state(path)
+    assert len(state) == workers * n
+    assert all(rec.status == "processed" for rec in state.values())
+
+def test_load_all_state_reads_both_files(tmp_path: Path) -> None:
+    """load_all_state returns the same data as the individual loaders."""
+    sync_path = tmp_path / "sync_state.json"
+    progress_path = tmp_path / "unit_progress.json"
+    update_sync_state("file:///a", last_checksum="c1", status="processed", path=sync_path)
+    progress: dict = {}
+    set_unit_progress(progress, "doc_a", 2, "c1")
+    save_unit_progress(progress, progress_path)
+    sync_state, unit_progress = asyncio.run(load_all_state(sync_path, progress_path))
+    assert sync_state == load_sync_state(sync_path)
+    assert unit_progress["doc_a"].last_unit_index == 2
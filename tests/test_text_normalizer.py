@@ -0,0 +1,19 @@
+"""Tests for rag.text_normalizer ligature and Unicode normalization."""
+
+from __future__ import annotations
+
+from rag.text_normalizer import LIGATURE_MAP, normalize_ligatures, normalize_text
+
+
+def test_normalize_ligatures_replaces_every_mapped_char() -> None:
+    """Each LIGATURE_MAP entry is replaced in a single pass; other text is untouched."""
+    text = "x".join(lig for lig, _ in LIGATURE_MAP)
+    expected = "x".join(repl for _, repl in LIGATURE_MAP)
+    assert normalize_ligatures(text) == expected
+    assert normalize_ligatures("plain ascii") == "plain ascii"
+
+
+def test_normalize_text_applies_nfc_then_ligatures() -> None:
+    """Decomposed accents are composed and ligatures expanded."""
+    assert normalize_text("cafe\u0301 \ufb01le") == "caf\u00e9 file"
+    assert normalize_text("") == ""
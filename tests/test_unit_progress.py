@@ -0,0 +1,46 @@
+"""Tests for unit-level checkpoint state (restart-at-page-N)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from state.unit_progress import load_unit_progress, save_unit_progress, set_unit_progress
+
+
+def test_set_unit_progress_updates_in_memory_and_keeps_checksum(tmp_path: Path) -> None:
+    """set_unit_progress mutates the loaded dict; a None checksum keeps the previous one."""
+    path = tmp_path / "unit_progress.json"
+    progress = load_unit_progress(path)
+    set_unit_progress(progress, "doc_a", 3, "abc")
+    set_unit_progress(progress, "doc_a", 4)
+    assert not path.exists()
+    save_unit_progress(progress, path)
+    loaded = load_unit_progress(path)
+    assert loaded["doc_a"].last_unit_index == 4
+    assert loaded["doc_a"].last_checksum == "abc"
+
+
+def test_load_unit_progress_accepts_utc_z_suffix(tmp_path: Path) -> None:
+    """Timestamps written with a trailing Z load as UTC-aware datetimes."""
+    path = tmp_path / "unit_progress.json"
+    path.write_text(
+        '{"doc_a": {"doc_id": "doc_a", "last_unit_index": 1, "updated_at": "2024-01-01T10:00:00Z"}}',
+        encoding="utf-8",
+    )
+    assert load_unit_progress(path)["doc_a"].updated_at == datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+
+
+def test_save_with_doc_ids_keeps_other_writers_records(tmp_path: Path) -> None:
+    """Saving only this run's doc_ids merges into the file instead of reverting other docs."""
+    path = tmp_path / "unit_progress.json"
+    run_a = load_unit_progress(path)
+    run_b = load_unit_progress(path)
+    set_unit_progress(run_a, "doc_a", 5)
+    save_unit_progress(run_a, path, doc_ids=["doc_a"])
+    set_unit_progress(run_b, "doc_b", 7)
+    save_unit_progress(run_b, path, doc_ids=["doc_b"])
+    loaded = load_unit_progress(path)
+    assert loaded["doc_a"].last_unit_index == 5
+    assert loaded["doc_b"].last_unit_index == 7
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["unit_progress.json", "unit_progress.json.lock"]
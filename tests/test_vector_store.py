@@ -1,31 +1,30 @@
-"""Tests for vector store: ChromaVectorStore with temp dir and fake vectors.
+"""Tests for vector store: ChromaVectorStore on an in-memory client with fake vectors.
 
 Uses small numeric vectors (dim=4); does not call the real embedder.
 """
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import uuid
 
+import numpy as np
 import pytest
 
 from vector_store import ChromaVectorStore
+from vector_store.chroma_store import MEMORY_PERSIST_DIR
 
 
-@pytest.fixture
-def temp_persist_dir() -> Path:
-    """Create a temporary directory for Chroma persistence."""
-    with tempfile.TemporaryDirectory(prefix="chroma_test_") as d:
-        yield Path(d)
+def _collection_name() -> str:
+    """Unique collection name: in-memory clients share data across the whole process."""
+    return f"chunks_{uuid.uuid4().hex[:12]}"
 
 
 @pytest.fixture
-def store(temp_persist_dir: Path) -> ChromaVectorStore:
-    """ChromaVectorStore backed by a temp directory."""
+def store() -> ChromaVectorStore:
+    """ChromaVectorStore on an in-memory client with a fresh collection (no disk I/O)."""
     return ChromaVectorStore(
-        persist_dir=str(temp_persist_dir),
-        collection_name="chunks",
+        persist_dir=MEMORY_PERSIST_DIR,
+        collection_name=_collection_name(),
     )
 
 
@@ -71,6 +70,31 @@ def test_has_id(store: ChromaVectorStore) -> None:
     assert store.has_id("c_nonexistent") is False
 
 
+def test_existing_ids_returns_present_subset(store: ChromaVectorStore) -> None:
+    """existing_ids returns only ids present in the store, in one lookup."""
+    store.add_embeddings(
+        ids=["c1", "c2"],
+        vectors=[[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        metadatas=[_meta("doc_a", "c1"), _meta("doc_a", "c2")],
+    )
+    assert store.existing_ids(["c1", "c_missing", "c2"]) == {"c1", "c2"}
+    assert store.existing_ids([]) == set()
+
+
+def test_has_ids_flags_every_id_across_lookup_chunks(store: ChromaVectorStore) -> None:
+    """has_ids reports presence for each id, including lists longer than one get chunk."""
+    store.add_embeddings(
+        ids=["c1", "c2"],
+        vectors=[[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        metadatas=[_meta("doc_a", "c1"), _meta("doc_a", "c2")],
+    )
+    ids = [f"missing_{i}" for i in range(1500)] + ["c2", "c1"]
+    flags = store.has_ids(ids)
+    assert flags["c1"] is True and flags["c2"] is True
+    assert sum(flags.values()) == 2
+    assert len(flags) == len(ids)
+
+
 def test_similarity_search_returns_k_results(store: ChromaVectorStore) -> None:
     """similarity_search returns up to k results with id, score, metadata."""
     ids = ["c1", "c2", "c3"]
@@ -91,7 +115,22 @@ def test_similarity_search_returns_k_results(store: ChromaVectorStore) -> None:
         assert "id" in r and "score" in r and "metadata" in r
         assert isinstance(r["metadata"], dict)
     assert results[0]["id"] == "c1"
-    assert results[0]["score"] >= results[1]["score"]
+    assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_similarity_search_many_matches_single_queries(store: ChromaVectorStore) -> None:
+    """One batched query returns the same per-query results as separate similarity_search calls."""
+    ids = ["c1", "c2", "c3"]
+    vectors = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]
+    store.add_embeddings(ids=ids, vectors=vectors, metadatas=[_meta("doc_a", i) for i in ids])
+
+    queries = np.array([vectors[2], vectors[0]], dtype=np.float32)
+    batched = store.similarity_search_many(queries, k=2)
+
+    assert [hits[0]["id"] for hits in batched] == ["c3", "c1"]
+    assert batched == [store.similarity_search(q, k=2) for q in queries]
+    assert store.similarity_search_many([], k=2) == []
 
 
 def test_delete_by_doc_removes_subset(store: ChromaVectorStore) -> None:
@@ -137,3 +176,57 @@ def test_add_embeddings_empty_no_op(store: ChromaVectorStore) -> None:
     """add_embeddings with empty lists does not raise and count stays 0."""
     store.add_embeddings(ids=[], vectors=[], metadatas=[])
     assert store.count() == 0
+
+
+def test_count_is_cached_and_refreshed_after_add(store: ChromaVectorStore) -> None:
+    """count() is served from cache between writes and stays exact when an add repeats ids."""
+    store.add_embeddings(ids=["c1"], vectors=[[1.0, 0.0, 0.0, 0.0]], metadatas=[_meta("doc_a", "c1")])
+    assert store.count() == 1
+    assert store.count() == 1
+    store.add_embeddings(
+        ids=["c1", "c2"],
+        vectors=[[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        metadatas=[_meta("doc_a", "c1"), _meta("doc_a", "c2")],
+    )
+    assert store.count() == 2
+
+
+def test_add_embeddings_accepts_numpy_batch(store: ChromaVectorStore) -> None:
+    """A 2-D float array is stored as-is; list and array queries both search it."""
+    vectors = np.eye(4, dtype=np.float64)[:2]
+    store.add_embeddings(ids=["c1", "c2"], vectors=vectors, metadatas=[_meta("doc_a", "c1"), _meta("doc_a", "c2")])
+    results = store.similarity_search([0.0, 1.0, 0.0, 0.0], k=1)
+    assert results[0]["id"] == "c2"
+    assert store.similarity_search(vectors[0], k=1)[0]["id"] == "c1"
+
+
+def test_renormalize_stores_unit_vectors() -> None:
+    """With renormalize=True, unnormalized input scores like its unit-length direction."""
+    store = ChromaVectorStore(persist_dir=MEMORY_PERSIST_DIR, collection_name=_collection_name(), renormalize=True)
+    vectors = [[3.0, 0.0, 0.0, 0.0], [0.0, 0.0, 5.0, 0.0]]
+    store.add_embeddings(ids=["c1", "c2"], vectors=vectors, metadatas=[_meta("doc_a", "c1"), _meta("doc_a", "c2")])
+    assert vectors[0] == [3.0, 0.0, 0.0, 0.0]
+    results = store.similarity_search([1.0, 0.0, 0.0, 0.0], k=1)
+    assert results[0]["id"] == "c1"
+    assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_add_embeddings_stream_reuses_buffer_across_batches(store: ChromaVectorStore) -> None:
+    """Rows spanning several batches (plus a partial one) are all stored with their own vectors."""
+    rows = ((f"c{i}", [float(i == j) for j in range(4)], _meta("doc_a", f"c{i}")) for i in range(4))
+    assert store.add_embeddings_stream(rows, batch_size=3) == 4
+    assert store.count() == 4
+    for i in range(4):
+        query = [float(i == j) for j in range(4)]
+        assert store.similarity_search(query, k=1)[0]["id"] == f"c{i}"
+
+
+def test_list_chunks_pairs_ids_with_metadata(store: ChromaVectorStore) -> None:
+    """list_chunks returns each stored id with its metadata."""
+    store.add_embeddings(
+        ids=["c1", "c2"],
+        vectors=[[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
+        metadatas=[_meta("doc_a", "c1"), _meta("doc_b", "c2")],
+    )
+    entries = {e["id"]: e["metadata"]["doc_id"] for e in store.list_chunks()}
+    assert entries == {"c1": "doc_a", "c2": "doc_b"}
@@ -1,6 +1,24 @@
 """Vector store layer: abstract interface and ChromaDB implementation."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from vector_store.base import BaseVectorStore
-from vector_store.chroma_store import ChromaVectorStore
+
+if TYPE_CHECKING:
+    from vector_store.chroma_store import ChromaVectorStore
+
+# chromadb is heavy to import; load the implementation on first access (PEP 562)
+_LAZY_EXPORTS = {"ChromaVectorStore": "vector_store.chroma_store"}
+
+
+def __getattr__(name: str) -> object:
+    """Import heavy exports on first access so importing the package stays cheap."""
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["BaseVectorStore", "ChromaVectorStore"]
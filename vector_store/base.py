@@ -34,6 +34,19 @@ class BaseVectorStore(ABC):
         """Return True if a vector with the given id exists in the store."""
         ...
 
+    def existing_ids(self, ids: list[str]) -> set[str]:
+        """Return the subset of ids already present in the store.
+
+        Default calls has_id per id; stores with a bulk lookup should override
+        this with a single round-trip.
+        """
+        return {id for id in ids if self.has_id(id)}
+
+    def has_ids(self, ids: list[str]) -> dict[str, bool]:
+        """Return id -> whether it is present, for every id; built on existing_ids."""
+        existing = self.existing_ids(ids)
+        return {id: id in existing for id in ids}
+
     @abstractmethod
     def delete_by_doc(self, doc_id: str) -> int:
         """Delete all vectors whose metadata has doc_id equal to the given value.
@@ -64,6 +77,18 @@ class BaseVectorStore(ABC):
         """
         ...
 
+    def similarity_search_many(
+        self,
+        query_vectors: list[list[float]],
+        k: int,
+    ) -> list[list[dict]]:
+        """Return similarity_search results for each query, in input order.
+
+        The default runs one search per query; backends that can batch
+        queries natively should override this.
+        """
+        return [self.similarity_search(q, k) for q in query_vectors]
+
     @abstractmethod
     def count(self) -> int:
         """Return the total number of vectors in the store."""
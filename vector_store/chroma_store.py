@@ -2,10 +2,48 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from itertools import zip_longest
+
 import chromadb
+import numpy as np
 
+from embeddings.normalize import l2_normalize_rows
 from vector_store.base import BaseVectorStore
 
+# persist_dir value selecting a non-persistent, in-process client (tests, scratch work)
+MEMORY_PERSIST_DIR = ":memory:"
+
+# Rows per Chroma add in add_embeddings_stream
+DEFAULT_STREAM_BATCH_SIZE = 1024
+
+# Ids per collection.get lookup, keeping each query well under SQLite's bound-parameter limit
+_GET_CHUNK = 1000
+
+# Collection settings for write-heavy ingestion; applied only when the collection is created
+_COLLECTION_METADATA = {"hnsw:space": "cosine", "hnsw:construction_ef": 100, "hnsw:M": 16}
+
+
+def _hits(
+    ids: list[str],
+    distances: list[float] | None,
+    metadatas: list[dict | None] | None,
+) -> list[dict]:
+    """Build id/score/metadata dicts for one query row of a Chroma result."""
+    if not ids:
+        return []
+    # Cosine distance: 0 = identical, 2 = opposite. Convert to similarity
+    # (1 = identical, -1 = opposite) for all hits in one array operation.
+    if distances:
+        scores = (1.0 - np.asarray(distances, dtype=np.float64)).tolist()
+    else:
+        scores = [1.0] * len(ids)
+    metas = metadatas or [{}] * len(ids)
+    return [
+        {"id": id, "score": score, "metadata": meta or {}}
+        for id, score, meta in zip(ids, scores, metas)
+    ]
+
 
 class ChromaVectorStore(BaseVectorStore):
     """Production-ready vector store using ChromaDB with persistent storage.
@@ -18,20 +56,32 @@ class ChromaVectorStore(BaseVectorStore):
         self,
         persist_dir: str = "data/vector_store",
         collection_name: str = "chunks",
+        renormalize: bool = False,
     ) -> None:
         """Initialize Chroma client and get or create the collection.
 
         Args:
-            persist_dir: Directory for Chroma persistence.
+            persist_dir: Directory for Chroma persistence, or ":memory:" for an
+                in-memory client with no disk I/O. In-memory clients in one process
+                share data, so use distinct collection names to keep stores apart.
             collection_name: Name of the collection for chunk vectors.
+            renormalize: If True, L2-normalize every added vector (one vectorized
+                pass per batch) instead of trusting the embedder to have done it.
         """
         self._persist_dir = persist_dir
         self._collection_name = collection_name
-        self._client = chromadb.PersistentClient(path=persist_dir)
+        self._renormalize = renormalize
+        if persist_dir == MEMORY_PERSIST_DIR:
+            self._client = chromadb.EphemeralClient()
+        else:
+            self._client = chromadb.PersistentClient(path=persist_dir)
         self._collection = self._client.get_or_create_collection(
             name=collection_name,
-            metadata={"hnsw:space": "cosine"},
+            metadata=dict(_COLLECTION_METADATA),
         )
+        self._max_add = max(1, self._client.get_max_batch_size())
+        # Cached count(); None means refetch from Chroma on next call
+        self._count_cache: int | None = None
 
     def add_embeddings(
         self,
@@ -41,6 +91,9 @@ class ChromaVectorStore(BaseVectorStore):
     ) -> None:
         """Add embedding vectors with ids and metadata.
 
+        Large inputs are split into slices of the client's max batch size, so
+        callers can pass a whole buffered write in one call.
+
         Args:
             ids: Unique identifiers for each vector (e.g. chunk_id).
             vectors: L2-normalized embedding vectors.
@@ -56,29 +109,109 @@ class ChromaVectorStore(BaseVectorStore):
             )
         if len(ids) == 0:
             return
-        # Ensure each vector is list[float] (e.g. from numpy)
-        embeddings = [
-            list(v) if not isinstance(v, list) else v for v in vectors
-        ]
+        embeddings = self._as_embeddings(vectors)
+        if self._renormalize:
+            # np.array copies, so the caller's vectors are never modified
+            embeddings = l2_normalize_rows(np.array(embeddings, dtype=np.float32))
+        self._add_rows(ids, embeddings, metadatas)
+
+    def add_embeddings_stream(
+        self,
+        rows: Iterable[tuple[str, list[float] | np.ndarray, dict]],
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> int:
+        """Add (id, vector, metadata) rows from an iterable in fixed-size batches.
+
+        Memory stays bounded by one batch however many rows there are: vectors
+        are copied into a single float32 buffer (allocated on the first row,
+        reused for every batch) and each full batch is one Chroma add.
+
+        Args:
+            rows: (id, vector, metadata) tuples; all vectors must have the same length.
+            batch_size: Rows per Chroma add.
+
+        Returns:
+            Number of rows passed to Chroma.
+        """
+        batch_size = max(1, batch_size)
+        buf: np.ndarray | None = None
+        ids: list[str] = []
+        metadatas: list[dict] = []
+        total = 0
+        for id, vector, metadata in rows:
+            if buf is None:
+                buf = np.empty((batch_size, len(vector)), dtype=np.float32)
+            buf[len(ids)] = vector
+            ids.append(id)
+            metadatas.append(metadata)
+            if len(ids) == batch_size:
+                total += self._add_buffered(ids, buf, metadatas)
+                ids, metadatas = [], []
+        if ids and buf is not None:
+            total += self._add_buffered(ids, buf, metadatas)
+        return total
+
+    def _add_buffered(self, ids: list[str], buf: np.ndarray, metadatas: list[dict]) -> int:
+        """Add the first len(ids) rows of buf (renormalized in place if enabled); return the row count."""
+        embeddings = buf[: len(ids)]
+        if self._renormalize:
+            l2_normalize_rows(embeddings)
+        self._add_rows(ids, embeddings, metadatas)
+        return len(ids)
+
+    def _add_rows(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]] | np.ndarray,
+        metadatas: list[dict],
+    ) -> None:
+        """Send rows to Chroma in slices of the client's max batch size."""
+        # Chroma skips ids it already has, so the new count is unknown until refetched
+        self._count_cache = None
         try:
-            self._collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                metadatas=metadatas,
-            )
+            for start in range(0, len(ids), self._max_add):
+                end = start + self._max_add
+                self._collection.add(
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end],
+                    metadatas=metadatas[start:end],
+                )
         except Exception as e:
             raise RuntimeError(
                 f"Chroma add failed: {e!s}"
             ) from e
 
+    @staticmethod
+    def _as_embeddings(vectors: list[list[float]] | np.ndarray) -> list[list[float]] | np.ndarray:
+        """Hand vectors to Chroma without per-element copies.
+
+        A 2-D array (or a list of 1-D arrays) becomes one contiguous float32
+        buffer; lists of float lists, as embedders return them, pass through.
+        """
+        if isinstance(vectors, np.ndarray):
+            return np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors and isinstance(vectors[0], np.ndarray):
+            return np.stack(vectors).astype(np.float32, copy=False)
+        return vectors
+
     def has_id(self, id: str) -> bool:
         """Return True if a vector with the given id exists in the store."""
+        return id in self.existing_ids([id])
+
+    def existing_ids(self, ids: list[str]) -> set[str]:
+        """Return the subset of ids already present.
+
+        One Chroma get (ids only, no embeddings or documents) per 1000 ids.
+        """
+        found: set[str] = set()
         try:
-            result = self._collection.get(ids=[id])
-            return len(result["ids"]) > 0
+            for start in range(0, len(ids), _GET_CHUNK):
+                result = self._collection.get(ids=ids[start : start + _GET_CHUNK], include=[])
+                found.update(result["ids"])
+            return found
         except Exception as e:
             raise RuntimeError(
-                f"Chroma get failed for id={id!r}: {e!s}"
+                f"Chroma get failed for {len(ids)} ids: {e!s}"
             ) from e
 
     def delete_by_doc(self, doc_id: str) -> int:
@@ -99,8 +232,11 @@ class ChromaVectorStore(BaseVectorStore):
             count = len(ids_to_delete)
             if count > 0:
                 self._collection.delete(ids=ids_to_delete)
+                if self._count_cache is not None:
+                    self._count_cache -= count
             return count
         except Exception as e:
+            self._count_cache = None
             raise RuntimeError(
                 f"Chroma delete_by_doc failed for doc_id={doc_id!r}: {e!s}"
             ) from e
@@ -121,11 +257,10 @@ class ChromaVectorStore(BaseVectorStore):
             )
             ids = result["ids"] or []
             metadatas = result["metadatas"] or []
-            out: list[dict] = []
-            for i, id in enumerate(ids):
-                meta = metadatas[i] if i < len(metadatas) else {}
-                out.append({"id": id, "metadata": meta})
-            return out
+            return [
+                {"id": id, "metadata": meta or {}}
+                for id, meta in zip_longest(ids, metadatas[: len(ids)], fillvalue={})
+            ]
         except Exception as e:
             raise RuntimeError(
                 f"Chroma list_chunks failed: {e!s}"
@@ -133,56 +268,69 @@ class ChromaVectorStore(BaseVectorStore):
 
     def similarity_search(
         self,
-        query_vector: list[float],
+        query_vector: list[float] | np.ndarray,
         k: int,
     ) -> list[dict]:
         """Return the k nearest vectors to the query by similarity.
 
         Args:
-            query_vector: L2-normalized query embedding.
+            query_vector: L2-normalized query embedding (list or 1-D array).
             k: Maximum number of results to return.
 
         Returns:
             List of dicts with keys: id, score, metadata.
             score is cosine similarity (higher is more similar).
         """
+        # One contiguous float32 row; Chroma would convert a list to this anyway
+        q_emb = np.ascontiguousarray(query_vector, dtype=np.float32).reshape(1, -1)
+        return self._query(q_emb, k, "similarity_search")[0]
+
+    def similarity_search_many(
+        self,
+        query_vectors: list[list[float]] | np.ndarray,
+        k: int,
+    ) -> list[list[dict]]:
+        """Return the k nearest vectors for each query, using one Chroma query.
+
+        Args:
+            query_vectors: L2-normalized query embeddings, shape (Q, dim).
+            k: Maximum number of results per query.
+
+        Returns:
+            One similarity_search-style result list per query, in input order.
+        """
+        if len(query_vectors) == 0:
+            return []
+        q_emb = np.ascontiguousarray(query_vectors, dtype=np.float32)
+        return self._query(q_emb, k, "similarity_search_many")
+
+    def _query(self, q_emb: np.ndarray, k: int, op: str) -> list[list[dict]]:
+        """Run one Chroma query for the (Q, dim) batch q_emb; return hits per query row."""
         try:
-            q_emb = (
-                list(query_vector)
-                if not isinstance(query_vector, list)
-                else query_vector
-            )
             result = self._collection.query(
-                query_embeddings=[q_emb],
+                query_embeddings=q_emb,
                 n_results=k,
-                include=["metadatas"],
+                include=["metadatas", "distances"],
             )
         except Exception as e:
-            raise RuntimeError(
-                f"Chroma similarity_search failed: {e!s}"
-            ) from e
-
-        ids = result["ids"]
-        distances = result["distances"]
-        metadatas = result["metadatas"]
-
-        if not ids or not ids[0]:
-            return []
-
-        # Cosine distance: 0 = identical, 2 = opposite. Convert to similarity.
-        # similarity = 1 - distance (so 1 = identical, -1 = opposite).
-        out: list[dict] = []
-        for i, id in enumerate(ids[0]):
-            dist = distances[0][i] if distances else 0.0
-            meta = metadatas[0][i] if metadatas and metadatas[0] else {}
-            score = float(1.0 - dist)
-            out.append({"id": id, "score": score, "metadata": meta})
-        return out
+            raise RuntimeError(f"Chroma {op} failed: {e!s}") from e
+        ids = result["ids"] or [[] for _ in range(len(q_emb))]
+        distances = result["distances"] or [None] * len(ids)
+        metadatas = result["metadatas"] or [None] * len(ids)
+        return [_hits(i, d, m) for i, d, m in zip(ids, distances, metadatas)]
 
     def count(self) -> int:
-        """Return the total number of vectors in the store."""
+        """Return the total number of vectors in the store.
+
+        Cached between writes made through this instance, so repeated polling
+        does not hit Chroma. Writes by other clients of the same directory are
+        not reflected until this instance writes again.
+        """
+        if self._count_cache is not None:
+            return self._count_cache
         try:
-            return self._collection.count()
+            self._count_cache = self._collection.count()
+            return self._count_cache
         except Exception as e:
             raise RuntimeError(
                 f"Chroma count failed: {e!s}"